@@ -0,0 +1,29 @@
+"""Store alert history notification channels as a bitmask
+
+Revision ID: alert_channels_001
+Revises: alert_cooldown_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+from app.db.migrations import ALERT_CHANNELS_TO_BITS
+
+revision = 'alert_channels_001'
+down_revision = 'alert_cooldown_001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.execute(ALERT_CHANNELS_TO_BITS)
+
+def downgrade():
+    op.execute("""
+        ALTER TABLE alert_history ALTER COLUMN notification_channels TYPE JSON USING (
+            to_json(ARRAY_REMOVE(ARRAY[
+                CASE WHEN notification_channels & 1 <> 0 THEN 'email' END,
+                CASE WHEN notification_channels & 2 <> 0 THEN 'push' END,
+                CASE WHEN notification_channels & 4 <> 0 THEN 'sms' END,
+                CASE WHEN notification_channels & 8 <> 0 THEN 'webhook' END
+            ], NULL))
+        )
+    """)
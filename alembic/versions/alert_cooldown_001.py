@@ -0,0 +1,25 @@
+"""Store each alert rule's cooldown end so matching can filter on it
+
+Revision ID: alert_cooldown_001
+Revises: alert_idx_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'alert_cooldown_001'
+down_revision = 'alert_idx_001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # alert_rules is created by the app, so guard like alert_idx_001 does
+    op.execute("ALTER TABLE alert_rules ADD COLUMN IF NOT EXISTS cooldown_until TIMESTAMP")
+    # Same end time AlertRule.start_cooldown would have written (cooldown + id % 60s jitter)
+    op.execute(
+        "UPDATE alert_rules SET cooldown_until = last_triggered "
+        "+ make_interval(mins => COALESCE(cooldown_minutes, 60), secs => id % 60) "
+        "WHERE cooldown_until IS NULL AND last_triggered IS NOT NULL"
+    )
+
+def downgrade():
+    op.execute("ALTER TABLE alert_rules DROP COLUMN IF EXISTS cooldown_until")
@@ -0,0 +1,24 @@
+"""Deduplicate triggered alerts per rule and minute
+
+Revision ID: alert_dedup_001
+Revises: alert_rule_idx_002
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'alert_dedup_001'
+down_revision = 'alert_rule_idx_002'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Existing rows keep a NULL bucket, which never conflicts
+    op.execute("ALTER TABLE alert_history ADD COLUMN IF NOT EXISTS trigger_bucket TIMESTAMP")
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_alert_history_rule_bucket "
+        "ON alert_history (rule_id, trigger_bucket)"
+    )
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ux_alert_history_rule_bucket")
+    op.execute("ALTER TABLE alert_history DROP COLUMN IF EXISTS trigger_bucket")
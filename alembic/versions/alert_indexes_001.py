@@ -0,0 +1,27 @@
+"""Indexes for alert rule matching and alert/scan history
+
+Revision ID: alert_idx_001
+Revises: users_trgm_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'alert_idx_001'
+down_revision = 'users_trgm_001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # The alert tables are created by the app (Base.metadata.create_all), not by
+    # an earlier revision, hence IF NOT EXISTS rather than op.create_index
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_alert_rules_asset_trigger_active "
+        "ON alert_rules (asset, trigger_type) WHERE is_active = true"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_alert_history_user_triggered ON alert_history (user_id, triggered_at DESC)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_portfolio_scans_user_scanned ON portfolio_scans (user_id, scanned_at DESC)")
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_portfolio_scans_user_scanned")
+    op.execute("DROP INDEX IF EXISTS ix_alert_history_user_triggered")
+    op.execute("DROP INDEX IF EXISTS ix_alert_rules_asset_trigger_active")
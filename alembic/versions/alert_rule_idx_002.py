@@ -0,0 +1,24 @@
+"""Indexes for per-user alert rule lookups and the price monitor
+
+Revision ID: alert_rule_idx_002
+Revises: alert_channels_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'alert_rule_idx_002'
+down_revision = 'alert_channels_001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # alert_rules is created by the app, hence IF NOT EXISTS as in alert_idx_001
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_alert_rules_trigger_cooldown_active "
+        "ON alert_rules (trigger_type, cooldown_until) WHERE is_active = true"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_alert_rules_user_id ON alert_rules (user_id)")
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_alert_rules_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_alert_rules_trigger_cooldown_active")
@@ -0,0 +1,22 @@
+"""Composite index for chart analysis history
+
+Revision ID: chart_history_idx_001
+Revises: reset_token_idx_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'chart_history_idx_001'
+down_revision = 'reset_token_idx_001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index('ix_chart_analyses_user_created', 'chart_analyses', ['user_id', sa.text('created_at DESC')])
+    # Leading column of ix_chart_analyses_user_created covers user-only lookups
+    op.drop_index('ix_chart_analyses_user_id', table_name='chart_analyses')
+
+def downgrade():
+    op.create_index('ix_chart_analyses_user_id', 'chart_analyses', ['user_id'])
+    op.drop_index('ix_chart_analyses_user_created', table_name='chart_analyses')
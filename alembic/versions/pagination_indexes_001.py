@@ -0,0 +1,26 @@
+"""Composite indexes for admin pagination
+
+Revision ID: pagination_idx_001
+Revises: 44fb429d2bdc
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'pagination_idx_001'
+down_revision = '44fb429d2bdc'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index('ix_signals_status_created', 'signals', ['status', sa.text('created_at DESC')])
+    op.create_index('ix_signals_symbol_created', 'signals', ['symbol', sa.text('created_at DESC')])
+    op.create_index('ix_users_tier_created', 'users', ['subscription_tier', sa.text('created_at DESC')])
+    # Leading column of ix_signals_status_created covers status-only lookups
+    op.drop_index('ix_signals_status', table_name='signals')
+
+def downgrade():
+    op.create_index('ix_signals_status', 'signals', ['status'])
+    op.drop_index('ix_users_tier_created', table_name='users')
+    op.drop_index('ix_signals_symbol_created', table_name='signals')
+    op.drop_index('ix_signals_status_created', table_name='signals')
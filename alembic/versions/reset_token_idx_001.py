@@ -0,0 +1,22 @@
+"""Partial index for password reset token lookups
+
+Revision ID: reset_token_idx_001
+Revises: alert_dedup_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'reset_token_idx_001'
+down_revision = 'alert_dedup_001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index(
+        'ix_users_reset_token', 'users', ['reset_token'],
+        postgresql_where=sa.text('reset_token IS NOT NULL'),
+    )
+
+def downgrade():
+    op.drop_index('ix_users_reset_token', table_name='users')
@@ -0,0 +1,20 @@
+"""Trigger-maintained dashboard counters
+
+Revision ID: stats_counters_001
+Revises: pagination_idx_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+from app.db.stats_counters import install_stats_counters, drop_stats_counters
+
+revision = 'stats_counters_001'
+down_revision = 'pagination_idx_001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    install_stats_counters(op.get_bind())
+
+def downgrade():
+    drop_stats_counters(op.get_bind())
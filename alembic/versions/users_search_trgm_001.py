@@ -0,0 +1,22 @@
+"""Trigram indexes for admin user search
+
+Revision ID: users_trgm_001
+Revises: stats_counters_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = 'users_trgm_001'
+down_revision = 'stats_counters_001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # ILIKE '%term%' can't use a b-tree; GIN trigram indexes serve it on PostgreSQL
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_full_name_trgm ON users USING gin (full_name gin_trgm_ops)")
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_users_full_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_email_trgm")
@@ -1,130 +1,325 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from typing import Optional
-from datetime import datetime, timedelta
+from sqlalchemy import func, desc, select, case, update, delete, inspect, literal, true
+from typing import Literal, Optional
+from datetime import datetime, timedelta, timezone
+import asyncio
+import time
 from app.db.session import get_db
+from app.db import stats_counters as counters
 from app.models.user import User
 from app.models.signal import Signal
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user_id, invalidate_active_user
+from app.core.security import create_access_token
+from app.api.endpoints.admin_ui import ADMIN_SESSION_COOKIE, reload_admin_pages
+from app.api.endpoints.auth import invalidate_me_cache
+from app.core.cache import TTLCache
 from app.core.logging import logger
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Simple admin check - in production, use a proper admin role
-# Use database is_admin column instead of hardcoded list
+# Query params typed with these are rejected with 422 before the handler runs
+Tier = Literal["lite", "pro", "elite"]
+SignalStatus = Literal["active", "hit_target", "hit_stop", "expired", "cancelled"]
 
-async def require_admin(current_user: User = Depends(get_current_user)) -> User:
-    if not getattr(current_user, "is_admin", False):
+# Admin access comes from the is_admin column. Confirmed admins are cached
+# by user id so admin requests only decode the token instead of loading the
+# full user row every time.
+ADMIN_CACHE_TTL = 60  # seconds
+_admin_cache = TTLCache(ADMIN_CACHE_TTL)
+
+def require_admin(
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+) -> int:
+    if _admin_cache.get(user_id):
+        return user_id
+    
+    row = db.execute(select(User.is_active, User.is_admin).where(User.id == user_id)).first()
+    if not row:
+        raise HTTPException(status_code=401, detail="User not found")
+    if not row.is_active:
+        raise HTTPException(status_code=403, detail="Account is deactivated")
+    if not row.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
-    return current_user
+    
+    _admin_cache.set(user_id, True)
+    return user_id
+
+ADMIN_SESSION_MAX_AGE = 12 * 60 * 60  # seconds
+
+BROADCAST_CONCURRENCY = 50  # stay well under the email provider rate limit
+BROADCAST_BATCH_SIZE = 500
 
 # ============== DASHBOARD STATS ==============
 
+# Dashboard stats change slowly relative to how often the admin UI polls them,
+# so serve them from a short-lived per-process cache.
+STATS_CACHE_TTL = 60  # seconds
+_stats_cache = {"at": 0.0, "data": None}
+
+
+def _invalidate_stats_cache():
+    _stats_cache["at"] = 0.0
+
+
+def _paginate(db: Session, stmt, page: int, per_page: int):
+    """Run a filtered select with COUNT(*) OVER () so the page and total come back together"""
+    offset = (page - 1) * per_page
+    rows = db.execute(
+        stmt.add_columns(func.count().over().label("total")).offset(offset).limit(per_page)
+    ).all()
+
+    if rows:
+        return rows, rows[0].total
+    if offset == 0:
+        return rows, 0
+
+    # Past the last page the window has nothing to count over
+    total = db.execute(select(func.count()).select_from(stmt.order_by(None).subquery())).scalar()
+    return rows, total
+
+def _count_where(condition):
+    """COUNT(*) FILTER (WHERE condition), portable across Postgres and SQLite"""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+_stats_counters = {"available": None}
+
+
+def _counters_available(db: Session) -> bool:
+    """Whether the trigger-maintained counter tables are installed (checked once per process)"""
+    if _stats_counters["available"] is None:
+        bind = db.get_bind()
+        _stats_counters["available"] = (
+            bind.dialect.name == "postgresql" and inspect(bind).has_table("user_stats")
+        )
+    return _stats_counters["available"]
+
+
+def _scan_stats(db: Session, week_ago: datetime, today: datetime):
+    # Both tables are aggregated in a single statement (two one-row
+    # sub-selects cross-joined) so the stats cost one round-trip.
+    user_stats = select(
+        func.count().label("total_users"),
+        _count_where(User.is_active == True).label("active_users"),
+        _count_where(User.created_at >= week_ago).label("new_users_week"),
+        _count_where(User.subscription_tier == "lite").label("lite_users"),
+        _count_where(User.subscription_tier == "pro").label("pro_users"),
+        _count_where(User.subscription_tier == "elite").label("elite_users"),
+    ).select_from(User).subquery()
+    
+    signal_stats = select(
+        func.count().label("total_signals"),
+        _count_where(Signal.status == "active").label("active_signals"),
+        _count_where(Signal.created_at >= today).label("signals_today"),
+        _count_where(Signal.signal_type == "buy").label("buy_signals"),
+        _count_where(Signal.signal_type == "sell").label("sell_signals"),
+        _count_where(Signal.signal_type == "hold").label("hold_signals"),
+        func.avg(Signal.oracle_score).label("avg_score"),
+    ).select_from(Signal).subquery()
+    
+    return db.execute(
+        select(user_stats, signal_stats).select_from(user_stats.join(signal_stats, true()))
+    ).one()
+
+
+def _counter_stats(db: Session, week_ago: datetime, today: datetime):
+    """Same shape as _scan_stats, read from the counter tables plus two indexed range counts"""
+    user_stats = select(
+        func.coalesce(func.sum(counters.user_stats.c.total_count), 0).label("total_users"),
+        func.coalesce(func.sum(counters.user_stats.c.active_count), 0).label("active_users"),
+        *[
+            func.coalesce(
+                func.sum(case((counters.user_stats.c.tier == tier, counters.user_stats.c.total_count), else_=0)), 0
+            ).label(f"{tier}_users")
+            for tier in ("lite", "pro", "elite")
+        ],
+    ).subquery()
+    
+    sig = counters.signal_stats.c
+    signal_stats = select(
+        func.coalesce(func.sum(sig.total_count), 0).label("total_signals"),
+        *[
+            func.coalesce(func.sum(case((condition, sig.total_count), else_=0)), 0).label(label)
+            for condition, label in (
+                (sig.status == "active", "active_signals"),
+                (sig.signal_type == "buy", "buy_signals"),
+                (sig.signal_type == "sell", "sell_signals"),
+                (sig.signal_type == "hold", "hold_signals"),
+            )
+        ],
+        (func.sum(sig.score_sum) / func.nullif(func.sum(sig.scored_count), 0)).label("avg_score"),
+    ).subquery()
+    
+    return db.execute(
+        select(
+            user_stats,
+            signal_stats,
+            select(func.count()).where(User.created_at >= week_ago).scalar_subquery().label("new_users_week"),
+            select(func.count()).where(Signal.created_at >= today).scalar_subquery().label("signals_today"),
+        ).select_from(user_stats.join(signal_stats, true()))
+    ).one()
+
+
+# ============== SESSION ==============
+
+@router.post("/session")
+def create_admin_session(
+    response: Response,
+    admin_id: int = Depends(require_admin)
+):
+    """Set the httpOnly cookie that unlocks the dashboard page at /admin/"""
+    response.set_cookie(
+        ADMIN_SESSION_COOKIE,
+        create_access_token(admin_id, timedelta(seconds=ADMIN_SESSION_MAX_AGE)),
+        max_age=ADMIN_SESSION_MAX_AGE,
+        path="/admin",
+        httponly=True,
+        secure=True,
+        samesite="strict",
+    )
+    return {"success": True}
+
+
+@router.delete("/session")
+def delete_admin_session(response: Response):
+    response.delete_cookie(ADMIN_SESSION_COOKIE, path="/admin", httponly=True, secure=True, samesite="strict")
+    return {"success": True}
+
+
 @router.get("/stats")
-async def get_dashboard_stats(
+def get_dashboard_stats(
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Get overall dashboard statistics"""
     
-    # User stats
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    
-    users_by_tier = db.query(
-        User.subscription_tier,
-        func.count(User.id)
-    ).group_by(User.subscription_tier).all()
-    
-    tier_counts = {tier: count for tier, count in users_by_tier}
+    if _stats_cache["data"] is not None and time.monotonic() - _stats_cache["at"] < STATS_CACHE_TTL:
+        return _stats_cache["data"]
     
-    # New users (last 7 days)
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    new_users_week = db.query(User).filter(User.created_at >= week_ago).count()
-    
-    # Signal stats
-    total_signals = db.query(Signal).count()
-    active_signals = db.query(Signal).filter(Signal.status == "active").count()
-    
-    signals_by_type = db.query(
-        Signal.signal_type,
-        func.count(Signal.id)
-    ).group_by(Signal.signal_type).all()
-    
-    type_counts = {stype: count for stype, count in signals_by_type}
+    return compute_dashboard_stats(db)
+
+
+def compute_dashboard_stats(db: Session) -> dict:
+    """Aggregate the dashboard stats and store them in the stats cache.
+
+    Also run by the scheduler ahead of expiry so the admin UI rarely pays for it.
+    """
+    # created_at columns are timezone-aware, so compare against aware UTC boundaries
+    now = datetime.now(timezone.utc)
+    week_ago = now - timedelta(days=7)
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     
-    # Signals today
-    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    signals_today = db.query(Signal).filter(Signal.created_at >= today).count()
+    if _counters_available(db):
+        row = _counter_stats(db, week_ago, today)
+    else:
+        row = _scan_stats(db, week_ago, today)
     
-    # Average oracle score
-    avg_score = db.query(func.avg(Signal.oracle_score)).scalar() or 0
+    avg_score = float(row.avg_score or 0)
     
     # Revenue estimate
-    pro_users = tier_counts.get("pro", 0)
-    elite_users = tier_counts.get("elite", 0)
-    mrr = pro_users * 98
+    mrr = row.pro_users * 98
     
-    return {
+    stats = {
         "users": {
-            "total": total_users,
-            "active": active_users,
-            "new_this_week": new_users_week,
+            "total": row.total_users,
+            "active": row.active_users,
+            "new_this_week": row.new_users_week,
             "by_tier": {
-                "lite": tier_counts.get("lite", 0),
-                "pro": tier_counts.get("pro", 0),
-                "elite": tier_counts.get("elite", 0),
+                "lite": row.lite_users,
+                "pro": row.pro_users,
+                "elite": row.elite_users,
             }
         },
         "signals": {
-            "total": total_signals,
-            "active": active_signals,
-            "today": signals_today,
+            "total": row.total_signals,
+            "active": row.active_signals,
+            "today": row.signals_today,
             "avg_oracle_score": round(avg_score, 1),
             "by_type": {
-                "buy": type_counts.get("buy", 0),
-                "sell": type_counts.get("sell", 0),
-                "hold": type_counts.get("hold", 0),
+                "buy": row.buy_signals,
+                "sell": row.sell_signals,
+                "hold": row.hold_signals,
             }
         },
         "revenue": {
             "mrr": mrr,
             "arr": mrr * 12,
         },
-        "generated_at": datetime.utcnow().isoformat()
+        "generated_at": now.isoformat()
     }
+    
+    _stats_cache["data"] = stats
+    _stats_cache["at"] = time.monotonic()
+    
+    return stats
 
 # ============== USER MANAGEMENT ==============
 
+def _set_user_tier(db: Session, user_id: int, tier: Tier):
+    """Update a user's tier, returning (user row, old_tier) or None if the user doesn't exist"""
+    if db.get_bind().dialect.name == "postgresql":
+        # RETURNING can read the pre-update row through a snapshot CTE: one round-trip
+        before = select(User.id, User.subscription_tier).where(User.id == user_id).cte("before")
+        row = db.execute(
+            update(User)
+            .where(User.id == before.c.id)
+            .values(subscription_tier=tier)
+            .returning(*USER_LIST_COLUMNS, before.c.subscription_tier.label("old_tier"))
+            .execution_options(synchronize_session=False)
+        ).first()
+        if not row:
+            return None
+        user = row._asdict()
+        return user, user.pop("old_tier")
+    
+    # SQLite's RETURNING only sees the updated row, so read the old tier first
+    old_tier = db.execute(select(User.subscription_tier).where(User.id == user_id)).first()
+    if not old_tier:
+        return None
+    user = db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(subscription_tier=tier)
+        .returning(*USER_LIST_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).one()
+    return user._asdict(), old_tier[0]
+
+# Fields behind each row of the admin users table
+USER_LIST_COLUMNS = (
+    User.id, User.email, User.full_name, User.subscription_tier, User.is_active,
+    User.is_verified, User.email_alerts, User.created_at, User.last_login,
+)
+
 @router.get("/users")
-async def list_users(
+def list_users(
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin),
+    admin_id: int = Depends(require_admin),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    tier: Optional[str] = None,
+    tier: Optional[Tier] = None,
     search: Optional[str] = None
 ):
     """List all users with pagination"""
     
-    query = db.query(User)
+    stmt = select(*USER_LIST_COLUMNS)
     
     if tier:
-        query = query.filter(User.subscription_tier == tier)
+        stmt = stmt.where(User.subscription_tier == tier)
     
     if search:
-        query = query.filter(
+        stmt = stmt.where(
             (User.email.ilike(f"%{search}%")) |
             (User.full_name.ilike(f"%{search}%"))
         )
     
-    total = query.count()
-    offset = (page - 1) * per_page
-    
-    users = query.order_by(desc(User.created_at)).offset(offset).limit(per_page).all()
+    users, total = _paginate(db, stmt.order_by(desc(User.created_at)), page, per_page)
     
-    return {
+    # Returned directly so jsonable_encoder is skipped and orjson encodes the datetimes
+    return ORJSONResponse({
         "users": [
             {
                 "id": u.id,
@@ -134,8 +329,8 @@ async def list_users(
                 "is_active": u.is_active,
                 "is_verified": u.is_verified,
                 "email_alerts": u.email_alerts,
-                "created_at": u.created_at.isoformat() if u.created_at else None,
-                "last_login": u.last_login.isoformat() if u.last_login else None,
+                "created_at": u.created_at,
+                "last_login": u.last_login,
             }
             for u in users
         ],
@@ -143,84 +338,94 @@ async def list_users(
         "page": page,
         "per_page": per_page,
         "pages": (total + per_page - 1) // per_page
-    }
+    })
 
 @router.get("/users/{user_id}")
-async def get_user(
+def get_user(
     user_id: int,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Get user details"""
     
-    user = db.query(User).filter(User.id == user_id).first()
+    # Explicit projection: credential columns like hashed_password never leave the DB
+    user = db.execute(
+        select(
+            User.id, User.email, User.full_name, User.subscription_tier, User.stripe_customer_id,
+            User.is_active, User.is_verified, User.email_alerts, User.push_alerts,
+            User.created_at, User.last_login,
+        ).where(User.id == user_id)
+    ).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return {
-        "id": user.id,
-        "email": user.email,
-        "full_name": user.full_name,
-        "subscription_tier": user.subscription_tier,
-        "stripe_customer_id": user.stripe_customer_id,
-        "is_active": user.is_active,
-        "is_verified": user.is_verified,
-        "email_alerts": user.email_alerts,
-        "push_alerts": user.push_alerts,
-        "created_at": user.created_at.isoformat() if user.created_at else None,
-        "last_login": user.last_login.isoformat() if user.last_login else None,
-    }
+    return user._asdict()
 
 @router.patch("/users/{user_id}/tier")
-async def update_user_tier(
+def update_user_tier(
     user_id: int,
-    tier: str,
+    tier: Tier,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Upgrade/downgrade user subscription tier"""
     
-    if tier not in ["lite", "pro", "elite"]:
-        raise HTTPException(status_code=400, detail="Invalid tier")
-    
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    row = _set_user_tier(db, user_id, tier)
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
     
-    old_tier = user.subscription_tier
-    user.subscription_tier = tier
     db.commit()
+    _invalidate_stats_cache()
+    invalidate_me_cache(user_id)
     
-    logger.info(f"Admin updated user {user.email} from {old_tier} to {tier}")
+    user, old_tier = row
+    logger.info(f"Admin updated user {user['email']} from {old_tier} to {tier}")
     
-    return {"message": f"User upgraded to {tier}", "user_id": user_id, "old_tier": old_tier, "new_tier": tier}
+    # The updated row lets the dashboard patch its table without refetching it
+    return {
+        "message": f"User upgraded to {tier}",
+        "user_id": user_id,
+        "old_tier": old_tier,
+        "new_tier": tier,
+        "user": user,
+    }
 
 @router.patch("/users/{user_id}/status")
-async def toggle_user_status(
+def toggle_user_status(
     user_id: int,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Activate/deactivate user"""
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    row = db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(is_active=~func.coalesce(User.is_active, False))
+        .returning(User.email, User.is_active)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
     
-    user.is_active = not user.is_active
     db.commit()
+    _invalidate_stats_cache()
     
-    status = "activated" if user.is_active else "deactivated"
-    logger.info(f"Admin {status} user {user.email}")
+    _admin_cache.pop(user_id)
+    invalidate_active_user(user_id)
+    invalidate_me_cache(user_id)
     
-    return {"message": f"User {status}", "user_id": user_id, "is_active": user.is_active}
+    status = "activated" if row.is_active else "deactivated"
+    logger.info(f"Admin {status} user {row.email}")
+    
+    return {"message": f"User {status}", "user_id": user_id, "is_active": row.is_active}
 
 # ============== SIGNAL MANAGEMENT ==============
 
 @router.get("/signals")
-async def list_signals(
+def list_signals(
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin),
+    admin_id: int = Depends(require_admin),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     status: Optional[str] = None,
@@ -228,20 +433,22 @@ async def list_signals(
 ):
     """List all signals with pagination"""
     
-    query = db.query(Signal)
+    stmt = select(
+        Signal.id, Signal.symbol, Signal.pair, Signal.signal_type, Signal.oracle_score,
+        Signal.entry_price, Signal.target_price, Signal.stop_loss, Signal.status,
+        Signal.outcome_pnl_percent, Signal.created_at, Signal.expires_at,
+    )
     
     if status:
-        query = query.filter(Signal.status == status)
+        stmt = stmt.where(Signal.status == status)
     
     if symbol:
-        query = query.filter(Signal.symbol == symbol.upper())
-    
-    total = query.count()
-    offset = (page - 1) * per_page
+        stmt = stmt.where(Signal.symbol == symbol.upper())
     
-    signals = query.order_by(desc(Signal.created_at)).offset(offset).limit(per_page).all()
+    signals, total = _paginate(db, stmt.order_by(desc(Signal.created_at)), page, per_page)
     
-    return {
+    # Returned directly so jsonable_encoder is skipped and orjson encodes the datetimes
+    return ORJSONResponse({
         "signals": [
             {
                 "id": s.id,
@@ -254,65 +461,74 @@ async def list_signals(
                 "stop_loss": s.stop_loss,
                 "status": s.status,
                 "outcome_pnl_percent": s.outcome_pnl_percent,
-                "created_at": s.created_at.isoformat() if s.created_at else None,
-                "expires_at": s.expires_at.isoformat() if s.expires_at else None,
+                "created_at": s.created_at,
+                "expires_at": s.expires_at,
             }
             for s in signals
         ],
         "total": total,
         "page": page,
         "per_page": per_page
-    }
+    })
 
 @router.patch("/signals/{signal_id}/status")
-async def update_signal_status(
+def update_signal_status(
     signal_id: int,
-    status: str,
+    status: SignalStatus,
     outcome_price: Optional[float] = None,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Update signal status (hit_target, hit_stop, expired, cancelled)"""
     
-    valid_statuses = ["active", "hit_target", "hit_stop", "expired", "cancelled"]
-    if status not in valid_statuses:
-        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
-    
-    signal = db.query(Signal).filter(Signal.id == signal_id).first()
-    if not signal:
-        raise HTTPException(status_code=404, detail="Signal not found")
-    
-    signal.status = status
-    signal.outcome_at = datetime.utcnow()
+    values = {"status": status, "outcome_at": func.now()}
     
     if outcome_price:
-        signal.outcome_price = outcome_price
-        # Calculate P&L
-        if signal.signal_type == "buy":
-            signal.outcome_pnl_percent = ((outcome_price - signal.entry_price) / signal.entry_price) * 100
-        else:
-            signal.outcome_pnl_percent = ((signal.entry_price - outcome_price) / signal.entry_price) * 100
+        # P&L computed in SQL so the row never has to be loaded
+        price = literal(outcome_price)
+        entry = func.nullif(Signal.entry_price, 0)
+        values["outcome_price"] = outcome_price
+        values["outcome_pnl_percent"] = case(
+            (Signal.signal_type == "buy", (price - entry) / entry * 100),
+            else_=(entry - price) / entry * 100,
+        )
+    
+    row = db.execute(
+        update(Signal)
+        .where(Signal.id == signal_id)
+        .values(**values)
+        .returning(Signal.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Signal not found")
     
     db.commit()
+    _invalidate_stats_cache()
     
     logger.info(f"Admin updated signal {signal_id} to {status}")
     
     return {"message": f"Signal updated to {status}", "signal_id": signal_id}
 
 @router.delete("/signals/{signal_id}")
-async def delete_signal(
+def delete_signal(
     signal_id: int,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Delete a signal"""
     
-    signal = db.query(Signal).filter(Signal.id == signal_id).first()
-    if not signal:
+    row = db.execute(
+        delete(Signal)
+        .where(Signal.id == signal_id)
+        .returning(Signal.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Signal not found")
     
-    db.delete(signal)
     db.commit()
+    _invalidate_stats_cache()
     
     logger.info(f"Admin deleted signal {signal_id}")
     
@@ -320,38 +536,57 @@ async def delete_signal(
 
 # ============== SYSTEM CONTROLS ==============
 
-@router.post("/system/scan")
+# Scan and cleanup can run for minutes, so they are queued as background tasks
+# (with their own DB sessions) and the request returns 202 straight away.
+
+@router.post("/system/scan", status_code=202)
 async def trigger_market_scan(
-    db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    background_tasks: BackgroundTasks,
+    admin_id: int = Depends(require_admin)
 ):
     """Manually trigger a market scan"""
     from app.services.scheduler import scheduled_market_scan
     
-    result = await scheduled_market_scan()
-    return {"message": "Scan completed", "result": result}
+    background_tasks.add_task(scheduled_market_scan)
+    return {"message": "Scan scheduled"}
 
-@router.post("/system/cleanup")
+@router.post("/system/cleanup", status_code=202)
 async def trigger_cleanup(
-    db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    background_tasks: BackgroundTasks,
+    admin_id: int = Depends(require_admin)
 ):
     """Manually trigger expired signal cleanup"""
     from app.services.scheduler import cleanup_expired_signals
     
-    await cleanup_expired_signals()
-    return {"message": "Cleanup completed"}
+    background_tasks.add_task(cleanup_expired_signals)
+    return {"message": "Cleanup scheduled"}
+
+@router.post("/system/reload-ui")
+def reload_admin_ui(admin_id: int = Depends(require_admin)):
+    """Re-read the admin page templates and assets from disk in this worker, e.g. after editing them"""
+    reload_admin_pages()
+    return {"message": "Admin UI reloaded"}
 
 @router.get("/system/health")
 async def get_system_health(
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Get detailed system health"""
     from app.services.scheduler import get_scheduled_jobs
     from app.services.email import email_service
+    from app.db.session import engine
+    
+    pool = engine.pool
     
     return {
         "api": "healthy",
+        "database_pool": {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "status": pool.status()
+        },
         "scheduler": {
             "status": "running",
             "jobs": get_scheduled_jobs()
@@ -360,16 +595,16 @@ async def get_system_health(
             "enabled": email_service.is_enabled(),
             "from": email_service.from_email
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 @router.post("/system/broadcast")
 async def broadcast_email(
     subject: str,
     message: str,
-    tier: Optional[str] = None,
+    tier: Optional[Tier] = None,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Send broadcast email to users"""
     from app.services.email import email_service
@@ -377,28 +612,40 @@ async def broadcast_email(
     if not email_service.is_enabled():
         raise HTTPException(status_code=503, detail="Email service not configured")
     
-    query = db.query(User).filter(User.is_active == True, User.email_alerts == True)
+    stmt = select(User.email).where(User.is_active.is_(True), User.email_alerts.is_(True))
     
     if tier:
-        query = query.filter(User.subscription_tier == tier)
+        stmt = stmt.where(User.subscription_tier == tier)
+    
+    # Stream recipients off a server-side cursor so memory stays flat however
+    # many users match. The query and every batch fetch are blocking driver
+    # calls, so they run in a worker thread, one at a time, off the event loop.
+    result = await asyncio.to_thread(
+        db.execute, stmt.execution_options(stream_results=True, yield_per=BROADCAST_BATCH_SIZE)
+    )
+    batches = result.scalars().partitions()
+    sem = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+    
+    async def _send(email: str) -> int:
+        async with sem:
+            try:
+                return int(await email_service.send_email(email, subject, message))
+            except Exception:
+                return 0
     
-    users = query.all()
     sent = 0
+    total = 0
+    while batch := await asyncio.to_thread(next, batches, None):
+        total += len(batch)
+        sent += sum(await asyncio.gather(*[_send(email) for email in batch]))
     
-    for user in users:
-        try:
-            await email_service.send_email(user.email, subject, message)
-            sent += 1
-        except:
-            pass
-    
-    return {"message": f"Broadcast sent to {sent} users", "total_recipients": len(users)}
+    return {"message": f"Broadcast sent to {sent} users", "total_recipients": total}
 
 
 @router.get("/debug/db-tables")
-async def debug_db_tables(
+def debug_db_tables(
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin)
+    admin_id: int = Depends(require_admin)
 ):
     """Debug database tables"""
     from sqlalchemy import text
@@ -422,7 +669,7 @@ async def debug_db_tables(
 
 
 @router.post("/migrate-referrals")
-async def migrate_referrals(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
+def migrate_referrals(db: Session = Depends(get_db), admin_id: int = Depends(require_admin)):
     """One-time migration to add referral columns (admin only)"""
     from sqlalchemy import text
     try:
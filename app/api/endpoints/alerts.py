@@ -3,22 +3,59 @@ ELUXRAJ Alert System
 Level 1: Automated alerts for ORACLE signals and whale movements
 """
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON, ForeignKey
-from datetime import datetime, timezone
-from typing import Optional, List
-from pydantic import BaseModel
-from app.db.session import get_db
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy.orm import Session, joinedload, relationship
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, Boolean, DateTime, JSON, ForeignKey, Index, or_, select, text, update
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
+import asyncio
+import enum
+import numpy as np
+from app.db.session import get_db, SessionLocal
 from app.db.base import Base
-from app.core.deps import get_current_user
+from app.core.deps import get_active_user_id, get_current_user
 from app.core.logging import logger
 import httpx
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Shared by all webhook deliveries so repeat hosts reuse pooled keep-alive
+# connections instead of a fresh TCP+TLS handshake per alert. Closed on
+# app shutdown via close_webhook_client().
+_webhook_client = httpx.AsyncClient(
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+)
+
+
+async def close_webhook_client():
+    await _webhook_client.aclose()
 
 
 # ============== MODELS ==============
 
+class NotificationChannel(enum.IntFlag):
+    """Bits of AlertHistory.notification_channels"""
+    EMAIL = 1
+    PUSH = 2
+    SMS = 4
+    WEBHOOK = 8
+
+    @classmethod
+    def mask(cls, names: List[str]) -> int:
+        mask = 0
+        for name in names:
+            mask |= cls[name.upper()]
+        return int(mask)
+
+    @classmethod
+    def names(cls, mask: int) -> List[str]:
+        return [channel.name.lower() for channel in cls if mask & channel]
+
+
 class AlertRule(Base):
     """User-defined alert rules"""
     __tablename__ = "alert_rules"
@@ -45,9 +82,32 @@ class AlertRule(Base):
     last_triggered = Column(DateTime, nullable=True)
     trigger_count = Column(Integer, default=0)
     cooldown_minutes = Column(Integer, default=60)  # Don't re-trigger for X minutes
+    cooldown_until = Column(DateTime, nullable=True)  # Set on trigger: last_triggered + cooldown + jitter
+    
+    user = relationship("User")
     
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    
+    def start_cooldown(self, now: datetime) -> None:
+        """Record a trigger at `now` and hold the rule back until its cooldown ends"""
+        self.last_triggered = now
+        self.cooldown_until = now + timedelta(minutes=self.cooldown_minutes) + cooldown_jitter(self.id)
+    
+    __table_args__ = (
+        # check_and_trigger_alerts runs on every scan/price tick; only active rules are ever matched
+        Index(
+            'ix_alert_rules_asset_trigger_active', 'asset', 'trigger_type',
+            postgresql_where=text('is_active = true'), sqlite_where=text('is_active = 1'),
+        ),
+        # The price monitor pulls every active rule of a trigger type that is out of cooldown
+        Index(
+            'ix_alert_rules_trigger_cooldown_active', 'trigger_type', 'cooldown_until',
+            postgresql_where=text('is_active = true'), sqlite_where=text('is_active = 1'),
+        ),
+        # Per-user rule listing, /status and the ownership check on update/delete
+        Index('ix_alert_rules_user_id', 'user_id'),
+    )
 
 
 class AlertHistory(Base):
@@ -65,9 +125,17 @@ class AlertHistory(Base):
     
     message = Column(String, nullable=False)
     notification_sent = Column(Boolean, default=False)
-    notification_channels = Column(JSON, default=list)
+    notification_channels = Column(SmallInteger, default=0)  # NotificationChannel bits
     
     triggered_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    # triggered_at truncated to the minute; NULL for manual test alerts
+    trigger_bucket = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        Index('ix_alert_history_user_triggered', 'user_id', triggered_at.desc()),
+        # At most one logged alert per rule per minute, however many scans race
+        Index('ux_alert_history_rule_bucket', 'rule_id', 'trigger_bucket', unique=True),
+    )
 
 
 class PortfolioScan(Base):
@@ -82,6 +150,185 @@ class PortfolioScan(Base):
     summary = Column(String, nullable=True)
     
     scanned_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    
+    __table_args__ = (
+        Index('ix_portfolio_scans_user_scanned', 'user_id', scanned_at.desc()),
+    )
+
+
+# ============== RULE CACHE ==============
+
+# Rules sharing a cooldown would otherwise all re-arm in the same minute
+# after a market move and fire together; offset each one by its id
+COOLDOWN_JITTER_SECONDS = 60
+
+
+def cooldown_jitter(rule_id: int) -> timedelta:
+    """Fixed per-rule delay added to the end of every cooldown"""
+    return timedelta(seconds=rule_id % COOLDOWN_JITTER_SECONDS)
+
+
+class cooldown_end(FunctionElement):
+    """SQL for start_cooldown's end time: cooldown_end(last_triggered, minutes, id)
+
+    Lets an UPDATE re-derive cooldown_until from the row's own columns;
+    NULL when the rule has never triggered.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+def _cooldown_end_parts(element, compiler, **kw):
+    last_triggered, minutes, rule_id = element.clauses
+    # Built as an expression so the compiler escapes % for pyformat drivers
+    jitter = rule_id % COOLDOWN_JITTER_SECONDS
+    return (compiler.process(arg, **kw) for arg in (last_triggered, minutes, jitter))
+
+
+@compiles(cooldown_end)
+def _cooldown_end_postgresql(element, compiler, **kw):
+    last_triggered, minutes, jitter = _cooldown_end_parts(element, compiler, **kw)
+    return f"{last_triggered} + make_interval(mins => {minutes}, secs => {jitter})"
+
+
+@compiles(cooldown_end, "sqlite")
+def _cooldown_end_sqlite(element, compiler, **kw):
+    last_triggered, minutes, jitter = _cooldown_end_parts(element, compiler, **kw)
+    return f"datetime({last_triggered}, '+' || {minutes} || ' minutes', '+' || ({jitter}) || ' seconds')"
+
+
+# Comparison opcode per rule condition; anything else never fires
+_GT, _LT = 0, 1
+_CONDITION_OPS = {
+    "above": _GT,
+    "below": _LT,
+    "crosses_above": _GT,  # TODO: Track previous value for true crossover
+    "crosses_below": _LT,
+}
+
+
+class CachedRule(NamedTuple):
+    """The fields check_and_trigger_alerts needs to decide whether a rule fires"""
+    id: int
+    condition: str
+    threshold: float
+    cooldown_until: Optional[datetime]
+
+    @classmethod
+    def from_rule(cls, rule: "AlertRule") -> "CachedRule":
+        return cls(rule.id, rule.condition, rule.threshold, rule.cooldown_until)
+
+    def ready_at(self) -> float:
+        """Epoch seconds at which the cooldown ends"""
+        if not self.cooldown_until:
+            return -np.inf
+        until = self.cooldown_until
+        if until.tzinfo is None:
+            # DateTime columns come back naive but are written in UTC
+            until = until.replace(tzinfo=timezone.utc)
+        return until.timestamp()
+
+
+class RuleArrays(NamedTuple):
+    """Column-wise copy of one (asset, trigger_type) bucket for vectorized matching"""
+    ids: np.ndarray
+    ops: np.ndarray
+    thresholds: np.ndarray
+    ready_at: np.ndarray
+
+    @classmethod
+    def build(cls, rules: List[CachedRule]) -> "RuleArrays":
+        n = len(rules)
+        return cls(
+            np.fromiter((r.id for r in rules), dtype=np.int64, count=n),
+            np.fromiter((_CONDITION_OPS.get(r.condition, -1) for r in rules), dtype=np.int8, count=n),
+            np.fromiter((r.threshold for r in rules), dtype=np.float64, count=n),
+            np.fromiter((r.ready_at() for r in rules), dtype=np.float64, count=n),
+        )
+
+    def match(self, value: float, now: datetime) -> List[int]:
+        fired = (self.ready_at <= now.timestamp()) & (
+            ((self.ops == _GT) & (value > self.thresholds))
+            | ((self.ops == _LT) & (value < self.thresholds))
+        )
+        return self.ids[fired].tolist()
+
+
+class RuleCache:
+    """Active alert rules grouped by (asset, trigger_type)
+
+    Rules change far less often than alerts are checked, so matching runs
+    against this snapshot and only rules that actually fire are loaded from
+    the database. Each bucket is also kept as NumPy arrays, rebuilt when
+    the bucket changes, so a tick compares every rule in one pass. The rule
+    endpoints update the cache in place; the scheduler reloads it every
+    RULE_CACHE_REFRESH_SECONDS to pick up writes made by other workers.
+    """
+
+    def __init__(self):
+        self._rules: Dict[Tuple[str, str], Dict[int, CachedRule]] = {}
+        self._keys: Dict[int, Tuple[str, str]] = {}
+        self._arrays: Dict[Tuple[str, str], RuleArrays] = {}
+        self.loaded = False
+
+    def load(self, db: Session) -> None:
+        rows = db.query(
+            AlertRule.id, AlertRule.asset, AlertRule.trigger_type, AlertRule.condition,
+            AlertRule.threshold, AlertRule.cooldown_until,
+        ).filter(AlertRule.is_active == True).all()
+
+        rules, keys = {}, {}
+        for row in rows:
+            key = (row.asset, row.trigger_type)
+            rules.setdefault(key, {})[row.id] = CachedRule(
+                row.id, row.condition, row.threshold, row.cooldown_until
+            )
+            keys[row.id] = key
+        # Swap whole dicts so concurrent readers never see a half-built snapshot
+        self._rules, self._keys, self._arrays = rules, keys, {}
+        self.loaded = True
+
+    def get(self, db: Session, asset: str, trigger_type: str) -> List[CachedRule]:
+        if not self.loaded:
+            self.load(db)
+        return list(self._rules.get((asset, trigger_type), {}).values())
+
+    def match(self, db: Session, asset: str, trigger_type: str, value: float, now: datetime) -> List[int]:
+        """Ids of active rules whose condition holds for value and whose cooldown is over"""
+        if not self.loaded:
+            self.load(db)
+        key = (asset, trigger_type)
+        arrays = self._arrays.get(key)
+        if arrays is None:
+            rules = self._rules.get(key)
+            if not rules:
+                return []
+            arrays = self._arrays[key] = RuleArrays.build(list(rules.values()))
+        return arrays.match(value, now)
+
+    def put(self, rule: "AlertRule") -> None:
+        """Add or replace a rule (an AlertRule or a row with the same columns); inactive rules are dropped"""
+        self.discard(rule.id)
+        if rule.is_active:
+            key = (rule.asset, rule.trigger_type)
+            self._rules.setdefault(key, {})[rule.id] = CachedRule.from_rule(rule)
+            self._keys[rule.id] = key
+            self._arrays.pop(key, None)
+
+    def discard(self, rule_id: int) -> None:
+        key = self._keys.pop(rule_id, None)
+        if key is not None:
+            self._rules.get(key, {}).pop(rule_id, None)
+            self._arrays.pop(key, None)
+
+    def clear(self) -> None:
+        self._rules, self._keys, self._arrays = {}, {}, {}
+        self.loaded = False
+
+
+RULE_CACHE_REFRESH_SECONDS = 30
+
+rule_cache = RuleCache()
 
 
 # ============== SCHEMAS ==============
@@ -109,13 +356,59 @@ class AlertRuleUpdate(BaseModel):
     cooldown_minutes: Optional[int] = None
 
 
-# ============== NOTIFICATION SERVICE ==============
+class AlertRuleOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    name: str
+    asset: str
+    asset_type: Optional[str]
+    trigger_type: str
+    condition: str
+    threshold: float
+    is_active: Optional[bool]
+    last_triggered: Optional[datetime]
+    trigger_count: Optional[int]
+    notify_email: Optional[bool]
+    notify_push: Optional[bool]
+    cooldown_minutes: Optional[int]
+
 
-async def send_notification(user_id: int, alert: AlertHistory, channels: List[str], db: Session):
-    """Send notifications through specified channels"""
-    from app.models.user import User
+class AlertRuleList(BaseModel):
+    ok: bool = True
+    count: int
+    rules: List[AlertRuleOut]
+
+
+class AlertHistoryOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
     
-    user = db.query(User).filter(User.id == user_id).first()
+    id: int
+    asset: str
+    trigger_type: str
+    trigger_value: float
+    threshold: float
+    message: str
+    notification_sent: Optional[bool]
+    triggered_at: datetime
+
+
+class AlertHistoryList(BaseModel):
+    ok: bool = True
+    count: int
+    alerts: List[AlertHistoryOut]
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize straight to JSON bytes in pydantic-core; returning a Response
+    also skips FastAPI re-validating the result against response_model"""
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+# ============== NOTIFICATION SERVICE ==============
+
+async def send_notification(user, alert: AlertHistory, rule: AlertRule, channels: List[str]):
+    """Send notifications through specified channels; the caller loads user and rule"""
     if not user:
         return
     
@@ -134,125 +427,160 @@ async def send_notification(user_id: int, alert: AlertHistory, channels: List[st
     if "push" in channels:
         try:
             # TODO: Integrate with Firebase/OneSignal
-            logger.info(f"Push alert to user {user_id}: {alert.message}")
+            logger.info(f"Push alert to user {user.id}: {alert.message}")
             sent_channels.append("push")
         except Exception as e:
             logger.error(f"Push notification failed: {e}")
     
     # Webhook
     if "webhook" in channels:
-        rule = db.query(AlertRule).filter(AlertRule.id == alert.rule_id).first()
-        if rule and rule.webhook_url:
+        if rule.webhook_url:
             try:
-                async with httpx.AsyncClient() as client:
-                    await client.post(rule.webhook_url, json={
-                        "alert_id": alert.id,
-                        "asset": alert.asset,
-                        "trigger_type": alert.trigger_type,
-                        "value": alert.trigger_value,
-                        "threshold": alert.threshold,
-                        "message": alert.message,
-                        "triggered_at": alert.triggered_at.isoformat()
-                    }, timeout=10.0)
+                await _webhook_client.post(rule.webhook_url, json={
+                    "alert_id": alert.id,
+                    "asset": alert.asset,
+                    "trigger_type": alert.trigger_type,
+                    "value": alert.trigger_value,
+                    "threshold": alert.threshold,
+                    "message": alert.message,
+                    "triggered_at": alert.triggered_at.isoformat()
+                })
                 sent_channels.append("webhook")
             except Exception as e:
                 logger.error(f"Webhook notification failed: {e}")
     
-    # Update alert history
+    # Update alert history; the caller commits
     alert.notification_sent = len(sent_channels) > 0
-    alert.notification_channels = sent_channels
-    db.commit()
+    alert.notification_channels = NotificationChannel.mask(sent_channels)
 
 
-async def check_and_trigger_alerts(asset: str, trigger_type: str, current_value: float, db: Session):
-    """Check all active rules and trigger alerts if conditions are met"""
-    from datetime import timedelta
+async def check_and_trigger_alerts(
+    asset: str, trigger_type: str, current_value: float, db: Session, now: Optional[datetime] = None
+):
+    """Check all active rules and trigger alerts if conditions are met
+
+    Batch callers pass `now` so every row they write shares one timestamp.
+    """
+    now = now or datetime.now(timezone.utc)
+    matched_ids = rule_cache.match(db, asset, trigger_type, current_value, now)
     
-    rules = db.query(AlertRule).filter(
-        AlertRule.asset == asset,
-        AlertRule.trigger_type == trigger_type,
-        AlertRule.is_active == True
+    if not matched_ids:
+        return
+    
+    # Only rules that fired are loaded, with their owners in the same query
+    # so deliveries need no per-alert lookups. The cooldown is checked again
+    # in case another worker fired a rule since this worker's cache saw it
+    rules = db.query(AlertRule).options(joinedload(AlertRule.user)).filter(
+        AlertRule.id.in_(matched_ids),
+        AlertRule.is_active == True,
+        or_(AlertRule.cooldown_until.is_(None), AlertRule.cooldown_until <= now)
     ).all()
+    if not rules:
+        return
     
-    now = datetime.now(timezone.utc)
+    bucket = now.replace(second=0, microsecond=0)
+    rows = [
+        {
+            "rule_id": rule.id,
+            "user_id": rule.user_id,
+            "asset": asset,
+            "trigger_type": trigger_type,
+            "trigger_value": current_value,
+            "threshold": rule.threshold,
+            "message": f"🚨 {asset} Alert: {trigger_type} is {current_value:.2f} ({rule.condition} {rule.threshold})",
+            "notification_sent": False,
+            "notification_channels": 0,
+            "triggered_at": now,
+            "trigger_bucket": bucket,
+        }
+        for rule in rules
+    ]
+    # Two scans racing on one asset can both get past the cooldown check; the
+    # unique (rule_id, trigger_bucket) index lets only one of them log the
+    # alert, and the loser's rules come back without an id and are skipped
+    inserted = dict(db.execute(
+        _insert_ignoring_duplicates(db).values(rows)
+        .on_conflict_do_nothing(index_elements=["rule_id", "trigger_bucket"])
+        .returning(AlertHistory.rule_id, AlertHistory.id)
+    ).all())
+    if not inserted:
+        db.rollback()
+        return
     
+    triggered_rules = []
     for rule in rules:
-        # Check cooldown
-        if rule.last_triggered:
-            cooldown_end = rule.last_triggered + timedelta(minutes=rule.cooldown_minutes)
-            if now < cooldown_end:
-                continue
+        if rule.id not in inserted:
+            continue
         
-        # Check condition
-        triggered = False
-        if rule.condition == "above" and current_value > rule.threshold:
-            triggered = True
-        elif rule.condition == "below" and current_value < rule.threshold:
-            triggered = True
-        elif rule.condition == "crosses_above" and current_value > rule.threshold:
-            triggered = True  # TODO: Track previous value for true crossover
-        elif rule.condition == "crosses_below" and current_value < rule.threshold:
-            triggered = True
+        # Update rule
+        rule.start_cooldown(now)
+        rule.trigger_count += 1
+        rule.updated_at = now
         
-        if triggered:
-            # Create alert message
-            message = f"🚨 {asset} Alert: {trigger_type} is {current_value:.2f} ({rule.condition} {rule.threshold})"
-            
-            # Log alert
-            alert = AlertHistory(
-                rule_id=rule.id,
-                user_id=rule.user_id,
-                asset=asset,
-                trigger_type=trigger_type,
-                trigger_value=current_value,
-                threshold=rule.threshold,
-                message=message
-            )
-            db.add(alert)
-            
-            # Update rule
-            rule.last_triggered = now
-            rule.trigger_count += 1
-            db.commit()
-            db.refresh(alert)
-            
-            # Determine channels
-            channels = []
-            if rule.notify_email:
-                channels.append("email")
-            if rule.notify_push:
-                channels.append("push")
-            if rule.webhook_url:
-                channels.append("webhook")
-            
-            # Send notifications
-            await send_notification(rule.user_id, alert, channels, db)
-            
-            logger.info(f"Alert triggered: {message}")
+        # Determine channels
+        channels = []
+        if rule.notify_email:
+            channels.append("email")
+        if rule.notify_push:
+            channels.append("push")
+        if rule.webhook_url:
+            channels.append("webhook")
+        
+        triggered_rules.append((rule, channels))
+    
+    # Log every alert and rule update in one transaction rather than one per rule
+    db.commit()
+    # The commit expired everything; reload in two queries instead of refreshing per object
+    alerts = {
+        alert.rule_id: alert
+        for alert in db.query(AlertHistory).filter(AlertHistory.id.in_(inserted.values())).all()
+    }
+    db.query(AlertRule).options(joinedload(AlertRule.user)).filter(AlertRule.id.in_(inserted.keys())).all()
+    for rule, _ in triggered_rules:
+        rule_cache.put(rule)
+    
+    # Deliveries are independent network calls, so overlap them
+    await asyncio.gather(*(
+        send_notification(rule.user, alerts[rule.id], rule, channels)
+        for rule, channels in triggered_rules
+    ))
+    # Logged before the commit expires the alerts again
+    for alert in alerts.values():
+        logger.info(f"Alert triggered: {alert.message}")
+    db.commit()
+
+
+def _insert_ignoring_duplicates(db: Session):
+    """INSERT into alert_history that can take ON CONFLICT DO NOTHING"""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(AlertHistory)
 
 
 # ============== API ENDPOINTS ==============
 
+_VALID_TRIGGERS = frozenset({"oracle_score", "price", "whale_movement", "volume", "rsi", "macd"})
+
 @router.post("/rules")
 async def create_alert_rule(
     rule: AlertRuleCreate,
-    user = Depends(get_current_user),
+    user_id: int = Depends(get_active_user_id),
     db: Session = Depends(get_db)
 ):
     """Create a new alert rule"""
     # Validate trigger type
-    valid_triggers = ["oracle_score", "price", "whale_movement", "volume", "rsi", "macd"]
-    if rule.trigger_type not in valid_triggers:
-        raise HTTPException(status_code=400, detail=f"Invalid trigger type. Must be one of: {valid_triggers}")
+    if rule.trigger_type not in _VALID_TRIGGERS:
+        raise HTTPException(status_code=400, detail=f"Invalid trigger type. Must be one of: {sorted(_VALID_TRIGGERS)}")
     
-    # Validate condition
-    valid_conditions = ["above", "below", "crosses_above", "crosses_below"]
-    if rule.condition not in valid_conditions:
-        raise HTTPException(status_code=400, detail=f"Invalid condition. Must be one of: {valid_conditions}")
+    # Validate condition; the matcher's opcode table is the list of supported conditions
+    if rule.condition not in _CONDITION_OPS:
+        raise HTTPException(status_code=400, detail=f"Invalid condition. Must be one of: {list(_CONDITION_OPS)}")
     
     # Create rule
     db_rule = AlertRule(
-        user_id=user.id,
+        user_id=user_id,
         name=rule.name,
         asset=rule.asset.upper(),
         asset_type=rule.asset_type,
@@ -266,75 +594,64 @@ async def create_alert_rule(
         cooldown_minutes=rule.cooldown_minutes
     )
     db.add(db_rule)
+    db.flush()
+    rule_id = db_rule.id
     db.commit()
-    db.refresh(db_rule)
+    # After the commit, like update and delete; reading the rule back costs
+    # one primary-key SELECT on an endpoint that is rarely called
+    rule_cache.put(db_rule)
     
-    return {"ok": True, "rule_id": db_rule.id, "message": "Alert rule created"}
+    return {"ok": True, "rule_id": rule_id, "message": "Alert rule created"}
+
 
+# Only the columns the response models read are selected
+RULE_LIST_COLUMNS = tuple(getattr(AlertRule, name) for name in AlertRuleOut.model_fields)
 
-@router.get("/rules")
+@router.get("/rules", response_model=AlertRuleList)
 async def get_alert_rules(
-    user = Depends(get_current_user),
+    user_id: int = Depends(get_active_user_id),
     db: Session = Depends(get_db)
 ):
     """Get all alert rules for current user"""
-    rules = db.query(AlertRule).filter(AlertRule.user_id == user.id).all()
+    rules = db.execute(select(*RULE_LIST_COLUMNS).where(AlertRule.user_id == user_id)).all()
     
-    return {
-        "ok": True,
-        "count": len(rules),
-        "rules": [
-            {
-                "id": r.id,
-                "name": r.name,
-                "asset": r.asset,
-                "asset_type": r.asset_type,
-                "trigger_type": r.trigger_type,
-                "condition": r.condition,
-                "threshold": r.threshold,
-                "is_active": r.is_active,
-                "last_triggered": r.last_triggered.isoformat() if r.last_triggered else None,
-                "trigger_count": r.trigger_count,
-                "notify_email": r.notify_email,
-                "notify_push": r.notify_push,
-                "cooldown_minutes": r.cooldown_minutes
-            }
-            for r in rules
-        ]
-    }
+    return _json_response(AlertRuleList(count=len(rules), rules=rules))
 
 
 @router.patch("/rules/{rule_id}")
 async def update_alert_rule(
     rule_id: int,
     updates: AlertRuleUpdate,
-    user = Depends(get_current_user),
+    user_id: int = Depends(get_active_user_id),
     db: Session = Depends(get_db)
 ):
     """Update an alert rule"""
-    rule = db.query(AlertRule).filter(
-        AlertRule.id == rule_id,
-        AlertRule.user_id == user.id
+    values = updates.model_dump(exclude_none=True)
+    if "cooldown_minutes" in values:
+        # A running cooldown follows the new length from its last trigger
+        values["cooldown_until"] = cooldown_end(
+            AlertRule.last_triggered, values["cooldown_minutes"], AlertRule.id
+        )
+    # One UPDATE ... RETURNING instead of loading the row to mutate it; the
+    # returned columns are what the rule cache needs
+    rule = db.execute(
+        update(AlertRule)
+        .where(AlertRule.id == rule_id, AlertRule.user_id == user_id)
+        .values(updated_at=datetime.now(timezone.utc), **values)
+        .returning(
+            AlertRule.id, AlertRule.asset, AlertRule.trigger_type, AlertRule.condition,
+            AlertRule.threshold, AlertRule.cooldown_until, AlertRule.is_active,
+        )
+        .execution_options(synchronize_session=False)
     ).first()
     
     if not rule:
         raise HTTPException(status_code=404, detail="Alert rule not found")
     
-    # Apply updates
-    if updates.name is not None:
-        rule.name = updates.name
-    if updates.threshold is not None:
-        rule.threshold = updates.threshold
-    if updates.is_active is not None:
-        rule.is_active = updates.is_active
-    if updates.notify_email is not None:
-        rule.notify_email = updates.notify_email
-    if updates.notify_push is not None:
-        rule.notify_push = updates.notify_push
-    if updates.cooldown_minutes is not None:
-        rule.cooldown_minutes = updates.cooldown_minutes
-    
     db.commit()
+    # Only once committed, so a failed commit can't leave the cache matching
+    # against values that were rolled back
+    rule_cache.put(rule)
     
     return {"ok": True, "message": "Alert rule updated"}
 
@@ -342,13 +659,13 @@ async def update_alert_rule(
 @router.delete("/rules/{rule_id}")
 async def delete_alert_rule(
     rule_id: int,
-    user = Depends(get_current_user),
+    user_id: int = Depends(get_active_user_id),
     db: Session = Depends(get_db)
 ):
     """Delete an alert rule"""
     rule = db.query(AlertRule).filter(
         AlertRule.id == rule_id,
-        AlertRule.user_id == user.id
+        AlertRule.user_id == user_id
     ).first()
     
     if not rule:
@@ -356,50 +673,59 @@ async def delete_alert_rule(
     
     db.delete(rule)
     db.commit()
+    rule_cache.discard(rule_id)
     
     return {"ok": True, "message": "Alert rule deleted"}
 
 
-@router.get("/history")
+ALERT_HISTORY_COLUMNS = tuple(getattr(AlertHistory, name) for name in AlertHistoryOut.model_fields)
+
+@router.get("/history", response_model=AlertHistoryList)
 async def get_alert_history(
     limit: int = 50,
-    user = Depends(get_current_user),
+    user_id: int = Depends(get_active_user_id),
     db: Session = Depends(get_db)
 ):
     """Get alert history for current user"""
-    alerts = db.query(AlertHistory).filter(
-        AlertHistory.user_id == user.id
-    ).order_by(AlertHistory.triggered_at.desc()).limit(limit).all()
+    alerts = db.execute(
+        select(*ALERT_HISTORY_COLUMNS)
+        .where(AlertHistory.user_id == user_id)
+        .order_by(AlertHistory.triggered_at.desc())
+        .limit(limit)
+    ).all()
     
-    return {
-        "ok": True,
-        "count": len(alerts),
-        "alerts": [
-            {
-                "id": a.id,
-                "asset": a.asset,
-                "trigger_type": a.trigger_type,
-                "trigger_value": a.trigger_value,
-                "threshold": a.threshold,
-                "message": a.message,
-                "notification_sent": a.notification_sent,
-                "triggered_at": a.triggered_at.isoformat()
-            }
-            for a in alerts
-        ]
-    }
+    return _json_response(AlertHistoryList(count=len(alerts), alerts=alerts))
+
+
+# Notifications and scans run as background tasks (with their own DB
+# sessions) so the request returns 202 without waiting on delivery or
+# market data; results show up in /history and /scan/history.
 
+async def _deliver_test_alert(alert_id: int, rule_id: int, channels: List[str]):
+    """Background half of POST /test/{rule_id}"""
+    db = SessionLocal()
+    try:
+        alert = db.get(AlertHistory, alert_id)
+        rule = db.get(AlertRule, rule_id, options=[joinedload(AlertRule.user)])
+        await send_notification(rule.user, alert, rule, channels)
+        db.commit()
+    except Exception as e:
+        logger.error(f"Test notification error: {e}")
+    finally:
+        db.close()
 
-@router.post("/test/{rule_id}")
+
+@router.post("/test/{rule_id}", status_code=202)
 async def test_alert_rule(
     rule_id: int,
-    user = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user_id: int = Depends(get_active_user_id),
     db: Session = Depends(get_db)
 ):
     """Send a test notification for an alert rule"""
     rule = db.query(AlertRule).filter(
         AlertRule.id == rule_id,
-        AlertRule.user_id == user.id
+        AlertRule.user_id == user_id
     ).first()
     
     if not rule:
@@ -408,7 +734,7 @@ async def test_alert_rule(
     # Create test alert
     alert = AlertHistory(
         rule_id=rule.id,
-        user_id=user.id,
+        user_id=user_id,
         asset=rule.asset,
         trigger_type=rule.trigger_type,
         trigger_value=rule.threshold,
@@ -416,10 +742,9 @@ async def test_alert_rule(
         message=f"🧪 TEST: {rule.name} - This is a test notification"
     )
     db.add(alert)
-    db.commit()
-    db.refresh(alert)
+    db.flush()
+    alert_id = alert.id
     
-    # Send notifications
     channels = []
     if rule.notify_email:
         channels.append("email")
@@ -428,101 +753,124 @@ async def test_alert_rule(
     if rule.webhook_url:
         channels.append("webhook")
     
-    await send_notification(user.id, alert, channels, db)
+    db.commit()
+    background_tasks.add_task(_deliver_test_alert, alert_id, rule_id, channels)
     
-    return {"ok": True, "message": "Test notification sent", "channels": channels}
+    return {"ok": True, "message": "Test notification queued", "channels": channels}
 
 
 # ============== PORTFOLIO SCAN ==============
 
-@router.post("/scan")
+SCAN_CONCURRENCY = 5  # keep market data providers under their rate limits
+
+async def _run_scan(user_id: int, assets: List[str]):
+    """Background half of POST /scan; the result is saved to scan history"""
+    from app.services.oracle import oracle
+    
+    # Assets are independent network-bound lookups, so fetch them side by side
+    semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+    
+    async def generate(asset: str):
+        async with semaphore:
+            return await oracle.generate_signal(asset)
+    
+    signals = await asyncio.gather(*(generate(asset) for asset in assets), return_exceptions=True)
+    # One timestamp for the scan and every alert it triggers
+    now = datetime.now(timezone.utc)
+    
+    db = SessionLocal()
+    try:
+        results = []
+        
+        # Alert checks share one DB session, so they stay sequential
+        for asset, signal in zip(assets, signals):
+            if isinstance(signal, Exception):
+                logger.error(f"Scan error for {asset}: {signal}")
+                continue
+            try:
+                if signal:
+                    score = signal.get("oracle_score", 50)
+                    signal_type = signal.get("signal_type", "hold")
+                    
+                    results.append({
+                        "asset": asset,
+                        "score": score,
+                        "signal": signal_type,
+                        "price": signal.get("entry_price"),
+                        "change_24h": signal.get("price_change_24h")
+                    })
+                    
+                    # Check alerts for this asset
+                    await check_and_trigger_alerts(asset, "oracle_score", score, db, now)
+                    
+            except Exception as e:
+                logger.error(f"Scan error for {asset}: {e}")
+        
+        # Save scan result
+        scan = PortfolioScan(
+            user_id=user_id,
+            assets_scanned=len(results),
+            signals=results,
+            summary=f"Scanned {len(results)} assets",
+            scanned_at=now
+        )
+        db.add(scan)
+        db.commit()
+    except Exception as e:
+        logger.error(f"Portfolio scan error: {e}")
+    finally:
+        db.close()
+
+
+@router.post("/scan", status_code=202)
 async def scan_portfolio(
+    background_tasks: BackgroundTasks,
     assets: List[str] = None,
-    user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    user_id: int = Depends(get_active_user_id)
 ):
     """Scan assets and check all alert rules"""
-    from app.services.oracle import oracle
-    
     # Default assets to scan
     if not assets:
         assets = ["BTC", "ETH"]
     
-    results = []
+    background_tasks.add_task(_run_scan, user_id, assets)
     
-    for asset in assets:
-        try:
-            signal = await oracle.generate_signal(asset)
-            if signal:
-                score = signal.get("oracle_score", 50)
-                signal_type = signal.get("signal_type", "hold")
-                
-                results.append({
-                    "asset": asset,
-                    "score": score,
-                    "signal": signal_type,
-                    "price": signal.get("entry_price"),
-                    "change_24h": signal.get("price_change_24h")
-                })
-                
-                # Check alerts for this asset
-                await check_and_trigger_alerts(asset, "oracle_score", score, db)
-                
-        except Exception as e:
-            logger.error(f"Scan error for {asset}: {e}")
-    
-    # Save scan result
-    scan = PortfolioScan(
-        user_id=user.id,
-        assets_scanned=len(results),
-        signals=results,
-        summary=f"Scanned {len(results)} assets"
-    )
-    db.add(scan)
-    db.commit()
-    
-    return {
-        "ok": True,
-        "scanned": len(results),
-        "results": results,
-        "scanned_at": datetime.now(timezone.utc).isoformat()
-    }
+    return {"ok": True, "status": "queued", "assets": assets}
+
 
+SCAN_HISTORY_COLUMNS = (
+    PortfolioScan.id, PortfolioScan.assets_scanned, PortfolioScan.signals,
+    PortfolioScan.summary, PortfolioScan.scanned_at,
+)
 
 @router.get("/scan/history")
 async def get_scan_history(
     limit: int = 10,
-    user = Depends(get_current_user),
+    user_id: int = Depends(get_active_user_id),
     db: Session = Depends(get_db)
 ):
     """Get portfolio scan history"""
-    scans = db.query(PortfolioScan).filter(
-        PortfolioScan.user_id == user.id
-    ).order_by(PortfolioScan.scanned_at.desc()).limit(limit).all()
+    scans = db.execute(
+        select(*SCAN_HISTORY_COLUMNS)
+        .where(PortfolioScan.user_id == user_id)
+        .order_by(PortfolioScan.scanned_at.desc())
+        .limit(limit)
+    ).all()
     
-    return {
+    return ORJSONResponse({
         "ok": True,
         "count": len(scans),
-        "scans": [
-            {
-                "id": s.id,
-                "assets_scanned": s.assets_scanned,
-                "signals": s.signals,
-                "summary": s.summary,
-                "scanned_at": s.scanned_at.isoformat()
-            }
-            for s in scans
-        ]
-    }
+        "scans": [s._asdict() for s in scans]
+    })
 
 
 # ============== ALERT MONITOR ENDPOINTS ==============
 
 @router.get("/status")
-async def get_alert_status(user=Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_alert_status(user_id: int = Depends(get_active_user_id), db: Session = Depends(get_db)):
     """Get alert system status for current user"""
     rules = db.query(AlertRule).filter(
-        AlertRule.user_id == user.id,
+        AlertRule.user_id == user_id,
         AlertRule.is_active == True
     ).all()
     
@@ -1,30 +1,51 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 from datetime import datetime, timedelta, timezone
 from app.db.session import get_db
 from app.models.user import User
-from app.schemas.user import UserCreate, UserLogin, UserResponse, Token, UserUpdate
-from app.core.security import get_password_hash, verify_password, create_access_token
-from app.core.deps import get_current_user
+from app.schemas.user import NormalizedEmail, UserCreate, UserLogin, UserResponse, Token, UserUpdate
+from app.core.security import hash_password_async, verify_and_update_password_async, create_access_token, DUMMY_PASSWORD_HASH
+from app.core.deps import get_current_user, get_current_user_id
+from app.core.cache import TTLCache
 from app.core.logging import logger
 
 router = APIRouter()
 
+# GET /me runs on nearly every page load but the profile rarely changes, so
+# serialized profiles are cached by user id. Writers in this process call
+# invalidate_me_cache; other workers catch up within the TTL.
+ME_CACHE_TTL = 30  # seconds
+_me_cache = TTLCache(ME_CACHE_TTL)
+
+
+def invalidate_me_cache(user_id: int) -> None:
+    _me_cache.pop(user_id)
+
+
+# Unique index behind the register duplicate check (001_initial)
+USERS_EMAIL_INDEX = "ix_users_email"
+
+
+def _is_duplicate_email(exc: IntegrityError) -> bool:
+    """Whether an INSERT into users failed on the email index rather than another constraint"""
+    # PostgreSQL drivers report the constraint name; SQLite only names the column
+    constraint = getattr(getattr(exc.orig, "diag", None), "constraint_name", None)
+    if constraint is not None:
+        return constraint == USERS_EMAIL_INDEX
+    return "users.email" in str(exc.orig)
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
     try:
         logger.info(f"Registering user: {user_data.email}")
         
-        existing_user = db.query(User).filter(User.email == user_data.email.lower()).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        hashed_pw = get_password_hash(user_data.password)
+        # Password hashing is deliberately slow; keep it off the event loop
+        hashed_pw = await hash_password_async(user_data.password)
         logger.info("Password hashed successfully")
         
         # Look up referrer if referral code provided
@@ -36,7 +57,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
                 logger.info(f"User referred by: {referrer.email}")
         
         user = User(
-            email=user_data.email.lower(),
+            email=user_data.email,
             hashed_password=hashed_pw,
             full_name=user_data.full_name,
             subscription_tier="lite",
@@ -50,13 +71,25 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         db.add(user)
         logger.info("User added to session")
         
-        db.commit()
-        logger.info("User committed to database")
+        # The unique index on users.email is the duplicate check, so the
+        # common path is a single INSERT. Its RETURNING fills in id and
+        # created_at; build the response before commit expires the instance
+        try:
+            db.flush()
+        except IntegrityError as e:
+            db.rollback()
+            if not _is_duplicate_email(e):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+        response = UserResponse.model_validate(user)
         
-        db.refresh(user)
-        logger.info(f"User created with ID: {user.id}")
+        db.commit()
+        logger.info(f"User created with ID: {response.id}")
         
-        return user
+        return response
         
     except HTTPException:
         raise
@@ -71,9 +104,17 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
 async def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """Login and get access token"""
     try:
-        user = db.query(User).filter(User.email == credentials.email.lower()).first()
+        # Only the columns login reads; last_login and the rehash are plain writes
+        user = db.execute(
+            select(User)
+            .options(load_only(User.id, User.hashed_password, User.is_active))
+            .where(User.email == credentials.email)
+        ).scalar_one_or_none()
         
-        if not user or not verify_password(credentials.password, user.hashed_password):
+        hashed_password = user.hashed_password if user else DUMMY_PASSWORD_HASH
+        password_ok, new_hash = await verify_and_update_password_async(credentials.password, hashed_password)
+        
+        if not user or not password_ok:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
@@ -86,9 +127,12 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
             )
         
         user.last_login = datetime.now(timezone.utc)
-        db.commit()
-        
+        if new_hash:
+            # Upgrade bcrypt (or older-cost) hashes now that we have the plaintext
+            user.hashed_password = new_hash
+        # Read before commit; afterwards the expired instance would reload the row
         access_token = create_access_token(subject=user.id)
+        db.commit()
         
         return Token(access_token=access_token)
         
@@ -102,9 +146,27 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
         )
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)):
     """Get current user profile"""
-    return current_user
+    profile = _me_cache.get(user_id)
+    if profile is not None:
+        return profile
+    
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is deactivated"
+        )
+    
+    profile = UserResponse.model_validate(user)
+    _me_cache.set(user_id, profile)
+    return profile
 
 @router.patch("/me", response_model=UserResponse)
 async def update_me(
@@ -113,16 +175,15 @@ async def update_me(
     current_user: User = Depends(get_current_user)
 ):
     """Update current user profile"""
-    if updates.full_name is not None:
-        current_user.full_name = updates.full_name
-    if updates.email_alerts is not None:
-        current_user.email_alerts = updates.email_alerts
-    if updates.push_alerts is not None:
-        current_user.push_alerts = updates.push_alerts
+    values = updates.model_dump(include={"full_name", "email_alerts", "push_alerts"}, exclude_none=True)
+    if values:
+        # One UPDATE; the session applies the same values to current_user in memory
+        db.query(User).filter(User.id == current_user.id).update(values, synchronize_session="evaluate")
     
+    response = UserResponse.model_validate(current_user)
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    invalidate_me_cache(current_user.id)
+    return response
 
 
 # Password Reset Endpoints
@@ -156,7 +217,7 @@ async def get_phone(user=Depends(get_current_user)):
 
 # Password Reset Models
 class ForgotPasswordRequest(BaseModel):
-    email: str
+    email: NormalizedEmail
 
 class ResetPasswordRequest(BaseModel):
     token: str
@@ -171,8 +232,8 @@ async def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(
     from sendgrid import SendGridAPIClient
     from sendgrid.helpers.mail import Mail
     
-    email = request.email.lower()
-    user = db.query(User).filter(User.email == email).first()
+    email = request.email
+    user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
     
     # Always return success to prevent email enumeration
     if not user:
@@ -224,24 +285,35 @@ async def forgot_password(request: ForgotPasswordRequest, db: Session = Depends(
 async def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db)):
     """Reset password using token"""
     
-    user = db.query(User).filter(User.reset_token == request.token).first()
+    token = db.execute(
+        select(User.id, User.reset_token_expires).where(User.reset_token == request.token)
+    ).first()
     
-    if not user:
+    if not token:
         raise HTTPException(status_code=400, detail="Invalid or expired reset token")
     
-    if user.reset_token_expires and user.reset_token_expires < datetime.now(timezone.utc):
+    if token.reset_token_expires and token.reset_token_expires < datetime.now(timezone.utc):
         raise HTTPException(status_code=400, detail="Reset token has expired. Please request a new one.")
     
     # Validate password
     if len(request.new_password) < 8:
         raise HTTPException(status_code=400, detail="Password must be at least 8 characters")
     
-    # Update password
-    user.hashed_password = get_password_hash(request.new_password)
-    user.reset_token = None
-    user.reset_token_expires = None
+    hashed_pw = await hash_password_async(request.new_password)
+    
+    # Consume the token in the same statement that sets the password, so two
+    # requests racing with one token can't both succeed
+    user_id = db.execute(
+        update(User)
+        .where(User.id == token.id, User.reset_token == request.token)
+        .values(hashed_password=hashed_pw, reset_token=None, reset_token_expires=None)
+        .returning(User.id)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+    if not user_id:
+        raise HTTPException(status_code=400, detail="Invalid or expired reset token")
     db.commit()
     
-    logger.info(f"Password reset successful for user {user.id}")
+    logger.info(f"Password reset successful for user {user_id}")
     
     return {"message": "Password reset successful. You can now log in with your new password."}
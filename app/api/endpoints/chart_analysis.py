@@ -1,31 +1,89 @@
 """Chart Analysis V2 - AI Vision Trade Intelligence"""
 from fastapi import APIRouter, File, UploadFile, Form, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Optional
+import asyncio
+import contextlib
+import hashlib
 import os
-import shutil
 from uuid import uuid4
 
 from app.db.session import get_db
-from app.core.deps import get_current_user
+from app.core.deps import get_active_user_id, get_current_user
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.logging import logger
 from app.services.trade_intelligence import trade_intelligence
 from app.services.rate_limiter import rate_limiter
 from app.models.chart_analysis import ChartAnalysis
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-UPLOADS_DIR = os.getenv("UPLOADS_DIR", "/tmp/eluxraj_uploads")
+UPLOADS_DIR = os.path.abspath(os.getenv("UPLOADS_DIR", "/tmp/eluxraj_uploads"))
 os.makedirs(UPLOADS_DIR, exist_ok=True)
 
-ALLOWED_TIMEFRAMES = {"5m", "15m", "30m", "1h", "2h", "4h", "8h", "12h", "24h", "1d", "3d", "1w", "1M"}
+UPLOAD_CHUNK_SIZE = 1 << 20  # bytes
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+
+
+def _image_extension(head: bytes) -> Optional[str]:
+    """Extension for a PNG or JPEG header, None for anything else"""
+    if head.startswith(PNG_SIGNATURE):
+        return "png"
+    if head.startswith(JPEG_SIGNATURE):
+        return "jpg"
+    return None
+
+
+def _save_upload(src, path: str) -> str:
+    """Copy the upload to path and return a digest of its bytes"""
+    digest = hashlib.blake2b(digest_size=16)
+    written = 0
+    try:
+        with open(path, "wb") as f:
+            while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                # Chunked requests carry no Content-Length for the middleware to check
+                written += len(chunk)
+                if written > settings.MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail="Upload too large")
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        # Never leave a partial upload behind
+        with contextlib.suppress(OSError):
+            os.remove(path)
+        raise
+    return digest.hexdigest()
+
+
+# Re-uploading the same screenshot (double paste, retry after a timeout)
+# reuses the earlier vision result for one candle of the chart's timeframe,
+# capped at a day. Keyed by image digest, asset and timeframe; failures aren't cached.
+TIMEFRAME_SECONDS = {
+    "5m": 300, "15m": 900, "30m": 1800, "1h": 3600, "2h": 7200, "4h": 14400,
+    "8h": 28800, "12h": 43200, "24h": 86400, "1d": 86400, "3d": 259200,
+    "1w": 604800, "1M": 2592000,
+}
+ANALYSIS_CACHE_MAX_TTL = 24 * 60 * 60  # seconds
+_analysis_cache = TTLCache(ANALYSIS_CACHE_MAX_TTL, maxsize=1000)
+
+
+CHART_DISCLAIMER = "ELUXRAJ provides AI-powered decision intelligence for informational purposes only. This is NOT financial advice."
+
+# Form fields typed with this are rejected with 422 before the handler runs,
+# so a bad timeframe no longer counts against the daily analysis limit
+Timeframe = Literal["5m", "15m", "30m", "1h", "2h", "4h", "8h", "12h", "24h", "1d", "3d", "1w", "1M"]
 
 
 @router.post("/analyze")
 async def analyze_chart(
     file: UploadFile = File(...),
     asset: str = Form(...),
-    timeframe: str = Form("4h"),
+    timeframe: Timeframe = Form("4h"),
     user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -41,46 +99,57 @@ async def analyze_chart(
     - Risk/Reward Analysis
     - Invalidation Conditions
     """
-    # Check rate limit (also checks tier access)
-    usage_info = rate_limiter.check_and_increment(
-        db=db,
-        user_id=user.id,
-        tier=user.subscription_tier,
-        feature="chart_analysis"
-    )
-    
-    # Validate timeframe
-    timeframe = timeframe.strip()
-    if timeframe not in ALLOWED_TIMEFRAMES:
-        raise HTTPException(status_code=400, detail=f"Invalid timeframe. Must be one of: {sorted(ALLOWED_TIMEFRAMES)}")
-    
-    # Validate file
-    content_type = file.content_type or ""
-    filename = (file.filename or "").lower()
-    if not (content_type.startswith("image/") or filename.endswith((".png", ".jpg", ".jpeg"))):
+    # Trust the file's leading bytes rather than the client's filename and
+    # content type; checked before the rate limiter so rejects aren't counted
+    head = await file.read(len(PNG_SIGNATURE))
+    await file.seek(0)
+    ext = _image_extension(head)
+    if ext is None:
         raise HTTPException(status_code=400, detail="File must be an image (PNG, JPG, JPEG)")
     
-    # Save file
-    ext = filename.split(".")[-1] if "." in filename else "png"
-    file_id = str(uuid4())
-    file_path = os.path.join(UPLOADS_DIR, f"{file_id}.{ext}")
+    # Save file before counting usage, so a 413 on an oversized chunked
+    # upload doesn't spend one of the user's analyses
+    file_path = f"{UPLOADS_DIR}/{uuid4().hex}.{ext}"
     
     try:
-        with open(file_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
+        # Large uploads spill to a temp file, so copying them is disk I/O
+        # that would otherwise block the event loop
+        image_digest = await asyncio.to_thread(_save_upload, file.file, file_path)
         logger.info(f"Saved chart image: {file_path}")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to save file: {e}")
         raise HTTPException(status_code=500, detail="Failed to save uploaded file")
     
-    # Analyze with AI
+    # Check rate limit (also checks tier access)
     try:
-        logger.info(f"Analyzing chart for {asset} ({timeframe})")
-        analysis = await trade_intelligence.analyze_chart_image(
-            image_path=file_path,
-            asset=asset.upper(),
-            timeframe=timeframe
+        usage_info = rate_limiter.check_and_increment(
+            db=db,
+            user_id=user.id,
+            tier=user.subscription_tier,
+            feature="chart_analysis"
         )
+    except HTTPException:
+        os.remove(file_path)
+        raise
+    
+    # Analyze with AI
+    try:
+        cache_key = (image_digest, asset.upper(), timeframe)
+        analysis = _analysis_cache.get(cache_key)
+        if analysis is None:
+            logger.info(f"Analyzing chart for {asset} ({timeframe})")
+            analysis = await trade_intelligence.analyze_chart_image(
+                image_path=file_path,
+                asset=asset.upper(),
+                timeframe=timeframe
+            )
+            if not analysis.get("error"):
+                ttl = min(TIMEFRAME_SECONDS[timeframe], ANALYSIS_CACHE_MAX_TTL)
+                _analysis_cache.set(cache_key, analysis, ttl=ttl)
+        else:
+            logger.info(f"Reusing cached chart analysis for {asset} ({timeframe})")
         
         # Save to database
         try:
@@ -101,10 +170,13 @@ async def analyze_chart(
                 status="active"
             )
             db.add(chart_record)
-            db.commit()
-            db.refresh(chart_record)
+            # Flush assigns the id; reading it before commit saves the
+            # SELECT that db.refresh would issue on the expired row
+            db.flush()
             analysis_id = chart_record.id
+            db.commit()
         except Exception as e:
+            db.rollback()
             logger.error(f"Failed to save chart analysis: {e}")
             analysis_id = None
         
@@ -118,32 +190,68 @@ async def analyze_chart(
         except:
             pass
     
-    return {
+    # Returned directly so jsonable_encoder doesn't walk the nested analysis
+    return ORJSONResponse({
         "analysis_id": analysis_id,
         "asset": asset.upper(),
         "timeframe": timeframe,
-        "analyzed_at": datetime.now(timezone.utc).isoformat(),
+        "analyzed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "usage": usage_info,
         **analysis,
-        "disclaimer": "ELUXRAJ provides AI-powered decision intelligence for informational purposes only. This is NOT financial advice."
-    }
+        "disclaimer": CHART_DISCLAIMER
+    })
+
+
+# History cursors are "<created_at as epoch microseconds>_<id>": URL-safe,
+# unlike an ISO timestamp whose "+00:00" offset decodes to a space in a query string
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _history_cursor(analysis: ChartAnalysis) -> str:
+    created_at = analysis.created_at
+    if created_at.tzinfo is None:
+        # SQLite hands back naive UTC timestamps
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return f"{(created_at - _EPOCH) // timedelta(microseconds=1)}_{analysis.id}"
+
+
+def _parse_history_cursor(cursor: str):
+    """Split a next_cursor into its (created_at, id) key"""
+    micros, _, analysis_id = cursor.partition("_")
+    try:
+        return _EPOCH + timedelta(microseconds=int(micros)), int(analysis_id)
+    except (ValueError, OverflowError):
+        raise HTTPException(status_code=422, detail="Invalid history cursor")
 
 
 @router.get("/history")
 async def get_analysis_history(
-    user = Depends(get_current_user),
+    user_id: int = Depends(get_active_user_id),
     db: Session = Depends(get_db),
-    limit: int = Query(20, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    before: Optional[str] = Query(None, description="next_cursor from the previous page")
 ):
-    """Get user's chart analysis history"""
-    analyses = db.query(ChartAnalysis).filter(
-        ChartAnalysis.user_id == user.id
-    ).order_by(ChartAnalysis.created_at.desc()).limit(limit).all()
+    """Get user's chart analysis history, newest first"""
+    # Keyset pagination walks ix_chart_analyses_user_created instead of
+    # counting past skipped rows the way OFFSET would. The id breaks ties
+    # between analyses saved in the same instant, so none are skipped.
+    query = select(ChartAnalysis).where(ChartAnalysis.user_id == user_id)
+    if before is not None:
+        query = query.where(
+            tuple_(ChartAnalysis.created_at, ChartAnalysis.id) < _parse_history_cursor(before)
+        )
+    query = query.order_by(ChartAnalysis.created_at.desc(), ChartAnalysis.id.desc())
+    analyses = db.scalars(query.limit(limit)).all()
     
-    return {
+    next_cursor = None
+    if analyses and len(analyses) == limit and analyses[-1].created_at:
+        next_cursor = _history_cursor(analyses[-1])
+    
+    return ORJSONResponse({
         "count": len(analyses),
-        "analyses": [_format_analysis(a) for a in analyses]
-    }
+        "analyses": [_format_analysis(a) for a in analyses],
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/{analysis_id}")
@@ -161,7 +269,7 @@ async def get_analysis(
     if not analysis:
         raise HTTPException(status_code=404, detail="Analysis not found")
     
-    return _format_analysis(analysis)
+    return ORJSONResponse(_format_analysis(analysis))
 
 
 def _format_analysis(a: ChartAnalysis) -> dict:
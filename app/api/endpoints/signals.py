@@ -3,7 +3,8 @@ Signal Ingestion & Notification API
 Receives signals from Lambda scanner and pushes to users
 """
 from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import desc
 from typing import Optional, List
 from datetime import datetime, timezone, timedelta
@@ -15,7 +16,7 @@ from app.core.deps import get_current_user
 from app.core.logging import logger
 import os
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Service key for Lambda authentication
 SERVICE_KEY = os.environ.get("ELUXRAJ_SERVICE_KEY", "eluxraj-lambda-signal-scanner-2026")
@@ -170,6 +171,21 @@ async def notify_users(
     }
 
 
+# Signal rows carry JSON/text columns (input_snapshot, reasoning_factors, ...)
+# that these listings never read, so only the serialized columns are loaded
+ACTIVE_SIGNAL_COLUMNS = (
+    Signal.id, Signal.symbol, Signal.signal_type, Signal.oracle_score,
+    Signal.timeframe, Signal.created_at, Signal.urgency, Signal.entry_price,
+    Signal.stop_loss, Signal.target_price, Signal.target_2, Signal.risk_reward,
+    Signal.pattern, Signal.catalyst, Signal.reasoning,
+)
+HISTORY_SIGNAL_COLUMNS = (
+    Signal.id, Signal.symbol, Signal.signal_type, Signal.oracle_score,
+    Signal.entry_price, Signal.target_price, Signal.stop_loss, Signal.status,
+    Signal.outcome_pnl_percent, Signal.created_at, Signal.outcome_at,
+)
+
+
 @router.get("/active")
 async def get_active_signals(
     db: Session = Depends(get_db),
@@ -178,7 +194,7 @@ async def get_active_signals(
 ):
     """Get active signals for the user's tier"""
     
-    signals = db.query(Signal).filter(
+    signals = db.query(Signal).options(load_only(*ACTIVE_SIGNAL_COLUMNS)).filter(
         Signal.status == "active"
     ).order_by(desc(Signal.created_at)).limit(limit).all()
     
@@ -221,7 +237,7 @@ async def get_signal_history(
 ):
     """Get signal history with outcomes"""
     
-    query = db.query(Signal)
+    query = db.query(Signal).options(load_only(*HISTORY_SIGNAL_COLUMNS))
     
     if status:
         query = query.filter(Signal.status == status)
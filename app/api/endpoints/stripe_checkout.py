@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Request, Depends
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, timezone
 import stripe
@@ -7,7 +8,8 @@ import os
 import secrets
 from app.db.session import get_db
 from app.models.user import User
-from app.core.security import get_password_hash
+from app.core.security import hash_password_async
+from app.api.endpoints.auth import invalidate_me_cache
 from app.core.logging import logger
 from app.services.email import email_service
 
@@ -133,7 +135,7 @@ async def claim_account(session_id: str, db: Session = Depends(get_db)):
     if not email:
         raise HTTPException(status_code=400, detail="Session has no customer email")
     
-    user = db.query(User).filter(User.email == email).first()
+    user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="Account still being created. Please wait a moment and refresh.")
     
@@ -228,7 +230,7 @@ async def _handle_checkout_completed(session: dict, db: Session):
             return
 
     # Look up existing user by email
-    user = db.query(User).filter(User.email == email).first()
+    user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
     is_new_user = user is None
 
     if is_new_user:
@@ -238,7 +240,7 @@ async def _handle_checkout_completed(session: dict, db: Session):
 
         user = User(
             email=email,
-            hashed_password=get_password_hash(random_password),
+            hashed_password=await hash_password_async(random_password),
             full_name=full_name or None,
             subscription_tier="pro",
             stripe_customer_id=stripe_customer_id,
@@ -266,6 +268,7 @@ async def _handle_checkout_completed(session: dict, db: Session):
         if full_name and not user.full_name:
             user.full_name = full_name
         db.commit()
+        invalidate_me_cache(user.id)
         logger.info(f"⬆️  Upgraded existing user {user.id} ({email}) to Pro")
 
     # Send welcome email with password setup link
@@ -305,6 +308,7 @@ async def _handle_subscription_deleted(subscription: dict, db: Session):
     user.subscription_tier = "lite"
     user.stripe_subscription_id = None
     db.commit()
+    invalidate_me_cache(user.id)
     logger.info(f"⬇️  Downgraded user {user.id} ({user.email}) to lite after cancellation")
 
 
@@ -0,0 +1,45 @@
+"""
+Small in-process TTL cache for hot lookups that tolerate brief staleness
+"""
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Dict-backed cache whose entries expire `ttl` seconds after being set.
+
+    Per-process only; callers that change the underlying data should `pop`
+    the affected key so this worker stops serving the old value at once.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 10_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value; `ttl` overrides the cache-wide lifetime for this entry"""
+        if key not in self._data and len(self._data) >= self.maxsize:
+            # Dicts keep insertion order, so this drops the oldest entry
+            self._data.pop(next(iter(self._data)), None)
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -8,14 +8,29 @@ class Settings(BaseSettings):
     APP_NAME: str = "ELUXRAJ API"
     VERSION: str = "1.0.0"
     DEBUG: bool = False
+    ADMIN_TITLE: str = os.getenv("ADMIN_TITLE", "ELUXRAJ Admin")
     
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", secrets.token_urlsafe(32))
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 365 * 100  # 100 years
     ALGORITHM: str = "HS256"
+    # Argon2id password hashing cost; benchmark on the deploy hardware and
+    # aim for a few hundred ms per hash. Memory is in KiB. Each hash records
+    # these values and any mismatch triggers a rehash on login, so keep them
+    # identical on every host rather than deriving them from the machine.
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", "3"))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", str(64 * 1024)))
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", "4"))
     
     # Database - Railway provides DATABASE_URL automatically
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./eluxraj.db")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "10"))  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # keep below the server idle timeout
+    
+    # Requests declaring a larger Content-Length are rejected with 413
+    MAX_UPLOAD_BYTES: int = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
     
     # Stripe
     STRIPE_SECRET_KEY: Optional[str] = os.getenv("STRIPE_SECRET_KEY")
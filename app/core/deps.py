@@ -1,12 +1,60 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.cache import TTLCache
 from app.core.security import decode_token
 from app.models.user import User
 
 security = HTTPBearer()
 
+def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> int:
+    """Decode the bearer token without loading the user row"""
+    user_id = decode_token(credentials.credentials)
+    
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+    
+    return user_id
+
+# Endpoints that only need the caller's id still have to reject deleted or
+# deactivated accounts. Confirmed active users are cached by id so those
+# requests skip the users table; admin.toggle_user_status pops the entry.
+ACTIVE_USER_CACHE_TTL = 60  # seconds
+_active_user_cache = TTLCache(ACTIVE_USER_CACHE_TTL)
+
+def get_active_user_id(
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+) -> int:
+    """Like get_current_user, but returns only the id of an active user"""
+    if _active_user_cache.get(user_id):
+        return user_id
+    
+    row = db.execute(select(User.is_active).where(User.id == user_id)).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
+    if not row.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is deactivated"
+        )
+    
+    _active_user_cache.set(user_id, True)
+    return user_id
+
+def invalidate_active_user(user_id: int) -> None:
+    _active_user_cache.pop(user_id)
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -1,11 +1,29 @@
-from datetime import datetime, timedelta
-from typing import Optional
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 import hashlib
+from app.core.cache import TTLCache
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes are Argon2id. bcrypt hashes from before the switch still verify
+# and are replaced on the user's next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# Checked against when a login names no account, so a miss costs the same
+# Argon2id verify as a wrong password and doesn't reveal which emails exist
+DUMMY_PASSWORD_HASH = pwd_context.hash("not-a-real-password")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     # Pre-hash long passwords to handle bcrypt 72-byte limit
@@ -13,26 +31,64 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         plain_password = hashlib.sha256(plain_password.encode()).hexdigest()
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Like verify_password, but also returns a replacement hash when the
+    stored one uses an outdated scheme or cost (None otherwise)"""
+    # Pre-hashed the same way as on hash, so long passwords keep verifying
+    if len(plain_password.encode('utf-8')) > 72:
+        plain_password = hashlib.sha256(plain_password.encode()).hexdigest()
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     # Pre-hash long passwords to handle bcrypt 72-byte limit
     if len(password.encode('utf-8')) > 72:
         password = hashlib.sha256(password.encode()).hexdigest()
     return pwd_context.hash(password)
 
+# Each Argon2 hash already runs ARGON2_PARALLELISM lanes, so more concurrent
+# hashes than cores / lanes just oversubscribe the CPU. Hashing gets its own
+# small pool so a login burst can't tie up the default executor either.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 1) // settings.ARGON2_PARALLELISM),
+    thread_name_prefix="password-hash",
+)
+
+async def hash_password_async(password: str) -> str:
+    """get_password_hash off the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, get_password_hash, password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password off the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor, verify_and_update_password, plain_password, hashed_password
+    )
+
 def create_access_token(subject: int, expires_delta: Optional[timedelta] = None) -> str:
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     
     to_encode = {"sub": str(subject), "exp": expire}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+# Every authenticated request decodes its bearer token. A token's subject
+# never changes, so verified tokens are cached until the TTL or their own
+# expiry, whichever comes first. Invalid tokens are never cached.
+TOKEN_CACHE_TTL = 60  # seconds
+_token_cache = TTLCache(TOKEN_CACHE_TTL)
+
 def decode_token(token: str) -> Optional[int]:
+    user_id = _token_cache.get(token)
+    if user_id is not None:
+        return user_id
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id = int(payload.get("sub"))
-        return user_id
     except JWTError:
         return None
+    
+    exp = payload.get("exp")
+    ttl = TOKEN_CACHE_TTL if exp is None else min(TOKEN_CACHE_TTL, exp - time.time())
+    if ttl > 0:
+        _token_cache.set(token, user_id, ttl=ttl)
+    return user_id
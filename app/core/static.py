@@ -0,0 +1,65 @@
+"""
+Static asset serving with content-hash cache busting
+"""
+import gzip
+import hashlib
+from pathlib import Path
+from starlette.staticfiles import StaticFiles
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STATIC_URL = "/static"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def versioned_url(path: str) -> str:
+    """URL for a file under app/static with its content hash as ?v=, so it can be cached forever"""
+    digest = hashlib.blake2b((STATIC_DIR / path).read_bytes(), digest_size=8).hexdigest()
+    return f"{STATIC_URL}/{path}?v={digest}"
+
+
+def etag_matches(if_none_match: str, etags: set) -> bool:
+    """Weak If-None-Match comparison against a set of quoted, unprefixed ETags"""
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or not etags.isdisjoint(tags)
+
+
+def compressed_variants(raw: bytes) -> dict:
+    """Encode a body once per content-coding, keyed by coding (None for identity)"""
+    variants = {None: raw, "gzip": gzip.compress(raw, 9)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(raw, quality=11)
+    return variants
+
+
+def pick_encoding(accept_encoding: str, variants: dict):
+    """Best precompressed coding in `variants` the client accepts, or None for identity"""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip())
+    for coding in ("br", "gzip"):
+        if coding in variants and coding in accepted:
+            return coding
+    return None
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks versioned (?v=...) requests immutable.
+
+    A new deploy changes the hash in the URL, so browsers and CDNs never need
+    to revalidate. Unversioned requests keep Starlette's ETag/Last-Modified
+    revalidation.
+    """
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304) and b"v=" in scope.get("query_string", b""):
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        return response
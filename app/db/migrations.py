@@ -4,6 +4,16 @@ Database migrations - runs on startup
 from sqlalchemy import text
 from app.core.logging import logger
 
+# email=1, push=2, sms=4, webhook=8 as in alerts.NotificationChannel
+ALERT_CHANNELS_TO_BITS = """
+    ALTER TABLE alert_history ALTER COLUMN notification_channels TYPE SMALLINT USING (
+        (CASE WHEN notification_channels::jsonb ? 'email' THEN 1 ELSE 0 END)
+        | (CASE WHEN notification_channels::jsonb ? 'push' THEN 2 ELSE 0 END)
+        | (CASE WHEN notification_channels::jsonb ? 'sms' THEN 4 ELSE 0 END)
+        | (CASE WHEN notification_channels::jsonb ? 'webhook' THEN 8 ELSE 0 END)
+    )::smallint
+"""
+
 
 def run_migrations(engine):
     """Run pending migrations"""
@@ -56,6 +66,135 @@ def run_migrations(engine):
         except Exception as e:
             logger.warning(f"Signal fields migration: {e}")
 
+        # Composite indexes for filtered, newest-first pagination
+        try:
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_signals_status_created ON signals (status, created_at DESC)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_signals_symbol_created ON signals (symbol, created_at DESC)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_tier_created ON users (subscription_tier, created_at DESC)"))
+            conn.execute(text("DROP INDEX IF EXISTS ix_signals_status"))
+            conn.commit()
+            logger.info("✅ Migration: pagination indexes ready")
+        except Exception as e:
+            logger.warning(f"Pagination indexes migration: {e}")
+
+        # Alert rule matching and per-user alert/scan history
+        try:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_alert_rules_asset_trigger_active "
+                "ON alert_rules (asset, trigger_type) WHERE is_active = true"
+            ))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_alert_history_user_triggered ON alert_history (user_id, triggered_at DESC)"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_portfolio_scans_user_scanned ON portfolio_scans (user_id, scanned_at DESC)"))
+            conn.commit()
+            logger.info("✅ Migration: alert indexes ready")
+        except Exception as e:
+            logger.warning(f"Alert indexes migration: {e}")
+
+        # Rule cooldowns become an indexable column instead of per-row date math
+        try:
+            conn.execute(text("ALTER TABLE alert_rules ADD COLUMN IF NOT EXISTS cooldown_until TIMESTAMP"))
+            conn.execute(text(
+                "UPDATE alert_rules SET cooldown_until = last_triggered "
+                "+ make_interval(mins => COALESCE(cooldown_minutes, 60), secs => id % 60) "
+                "WHERE cooldown_until IS NULL AND last_triggered IS NOT NULL"
+            ))
+            conn.commit()
+            logger.info("✅ Migration: alert rule cooldown_until ready")
+        except Exception as e:
+            logger.warning(f"Alert cooldown migration: {e}")
+
+        # Alert history channels move from a JSON list to NotificationChannel bits
+        try:
+            kind = conn.execute(text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_name = 'alert_history' AND column_name = 'notification_channels'"
+            )).scalar()
+            if kind in ("json", "jsonb"):
+                conn.execute(text(ALERT_CHANNELS_TO_BITS))
+            conn.commit()
+            logger.info("✅ Migration: alert history channel bits ready")
+        except Exception as e:
+            logger.warning(f"Alert channels migration: {e}")
+
+        # Alert rule lookups by owner and by the price monitor
+        try:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_alert_rules_trigger_cooldown_active "
+                "ON alert_rules (trigger_type, cooldown_until) WHERE is_active = true"
+            ))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_alert_rules_user_id ON alert_rules (user_id)"))
+            conn.commit()
+            logger.info("✅ Migration: alert rule lookup indexes ready")
+        except Exception as e:
+            logger.warning(f"Alert rule lookup indexes migration: {e}")
+
+        # One logged alert per rule per minute, even when scans race
+        try:
+            conn.execute(text("ALTER TABLE alert_history ADD COLUMN IF NOT EXISTS trigger_bucket TIMESTAMP"))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ux_alert_history_rule_bucket "
+                "ON alert_history (rule_id, trigger_bucket)"
+            ))
+            conn.commit()
+            logger.info("✅ Migration: alert history dedup index ready")
+        except Exception as e:
+            logger.warning(f"Alert dedup migration: {e}")
+
+        # Password reset token lookups
+        try:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_users_reset_token ON users (reset_token) "
+                "WHERE reset_token IS NOT NULL"
+            ))
+            conn.commit()
+            logger.info("✅ Migration: reset token index ready")
+        except Exception as e:
+            logger.warning(f"Reset token index migration: {e}")
+
+        # Newest-first chart analysis history per user
+        try:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_chart_analyses_user_created "
+                "ON chart_analyses (user_id, created_at DESC)"
+            ))
+            conn.execute(text("DROP INDEX IF EXISTS ix_chart_analyses_user_id"))
+            conn.commit()
+            logger.info("✅ Migration: chart history index ready")
+        except Exception as e:
+            logger.warning(f"Chart history index migration: {e}")
+
+        # Time-range scans over all signals regardless of status. Alembic
+        # databases already have this index from 001_initial
+        try:
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_signals_created_at "
+                "ON signals (created_at)"
+            ))
+            conn.commit()
+            logger.info("✅ Migration: signal created_at index ready")
+        except Exception as e:
+            logger.warning(f"Signal created_at index migration: {e}")
+
+    # Dashboard counters rely on plpgsql triggers
+    if engine.dialect.name == "postgresql":
+        from app.db.stats_counters import install_stats_counters
+        try:
+            with engine.begin() as conn:
+                install_stats_counters(conn)
+            logger.info("✅ Migration: dashboard stats counters ready")
+        except Exception as e:
+            logger.warning(f"Stats counters migration: {e}")
+
+        # Trigram indexes so admin user search (ILIKE '%term%') avoids a seq scan
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops)"))
+                conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_full_name_trgm ON users USING gin (full_name gin_trgm_ops)"))
+            logger.info("✅ Migration: user search trigram indexes ready")
+        except Exception as e:
+            logger.warning(f"Trigram indexes migration: {e}")
+
 
 def add_push_subscription_column(engine):
     """Add push_subscription column to users table"""
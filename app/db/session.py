@@ -14,12 +14,18 @@ connect_args = {}
 if database_url.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
+# LIFO checkout keeps reusing the few connections that are warm, so the
+# rest sit idle long enough for pool_recycle (or PgBouncer's idle timeout)
+# to close them instead of every worker holding pool_size open sockets.
 engine = create_engine(
     database_url,
     connect_args=connect_args,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
+    pool_use_lifo=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
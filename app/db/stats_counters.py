@@ -0,0 +1,157 @@
+"""
+Trigger-maintained counters for the admin dashboard (PostgreSQL only)
+
+user_stats keeps per-tier user totals and signal_stats keeps per
+status/type signal totals, so /admin/stats reads a handful of rows instead
+of scanning users and signals on every cache miss.
+"""
+from sqlalchemy import text, table, column, Integer, String, Float
+
+user_stats = table(
+    "user_stats",
+    column("tier", String),
+    column("active_count", Integer),
+    column("total_count", Integer),
+)
+
+signal_stats = table(
+    "signal_stats",
+    column("status", String),
+    column("signal_type", String),
+    column("total_count", Integer),
+    column("score_sum", Float),
+    column("scored_count", Integer),
+)
+
+CREATE_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS user_stats (
+        tier VARCHAR(20) PRIMARY KEY,
+        active_count INTEGER NOT NULL DEFAULT 0,
+        total_count INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS signal_stats (
+        status VARCHAR(20) NOT NULL,
+        signal_type VARCHAR(10) NOT NULL,
+        total_count INTEGER NOT NULL DEFAULT 0,
+        score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+        scored_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (status, signal_type)
+    )
+    """,
+    # The remaining scans on /admin/stats are date ranges
+    "CREATE INDEX IF NOT EXISTS ix_users_created_at ON users (created_at)",
+]
+
+# Each trigger backs out the OLD row and applies the NEW one, so updates
+# that move a row between buckets are just a DELETE followed by an INSERT.
+CREATE_FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION user_stats_apply() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE user_stats
+            SET total_count = total_count - 1,
+                active_count = active_count - (CASE WHEN OLD.is_active THEN 1 ELSE 0 END)
+            WHERE tier = COALESCE(OLD.subscription_tier, '');
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO user_stats (tier, active_count, total_count)
+            VALUES (COALESCE(NEW.subscription_tier, ''), CASE WHEN NEW.is_active THEN 1 ELSE 0 END, 1)
+            ON CONFLICT (tier) DO UPDATE
+            SET total_count = user_stats.total_count + 1,
+                active_count = user_stats.active_count + EXCLUDED.active_count;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION signal_stats_apply() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE signal_stats
+            SET total_count = total_count - 1,
+                score_sum = score_sum - COALESCE(OLD.oracle_score, 0),
+                scored_count = scored_count - (CASE WHEN OLD.oracle_score IS NULL THEN 0 ELSE 1 END)
+            WHERE status = COALESCE(OLD.status, '') AND signal_type = COALESCE(OLD.signal_type, '');
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO signal_stats (status, signal_type, total_count, score_sum, scored_count)
+            VALUES (
+                COALESCE(NEW.status, ''), COALESCE(NEW.signal_type, ''), 1,
+                COALESCE(NEW.oracle_score, 0), CASE WHEN NEW.oracle_score IS NULL THEN 0 ELSE 1 END
+            )
+            ON CONFLICT (status, signal_type) DO UPDATE
+            SET total_count = signal_stats.total_count + 1,
+                score_sum = signal_stats.score_sum + EXCLUDED.score_sum,
+                scored_count = signal_stats.scored_count + EXCLUDED.scored_count;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+# Backfill and trigger creation happen under a lock so no write slips in
+# between the snapshot count and the trigger going live.
+INSTALL_TRIGGERS = [
+    "LOCK TABLE users, signals IN SHARE ROW EXCLUSIVE MODE",
+    "DELETE FROM user_stats",
+    """
+    INSERT INTO user_stats (tier, active_count, total_count)
+    SELECT COALESCE(subscription_tier, ''), COUNT(*) FILTER (WHERE is_active), COUNT(*)
+    FROM users GROUP BY 1
+    """,
+    "DELETE FROM signal_stats",
+    """
+    INSERT INTO signal_stats (status, signal_type, total_count, score_sum, scored_count)
+    SELECT COALESCE(status, ''), COALESCE(signal_type, ''), COUNT(*),
+           COALESCE(SUM(oracle_score), 0), COUNT(oracle_score)
+    FROM signals GROUP BY 1, 2
+    """,
+    """
+    CREATE TRIGGER users_stats_trg
+    AFTER INSERT OR DELETE OR UPDATE OF subscription_tier, is_active ON users
+    FOR EACH ROW EXECUTE FUNCTION user_stats_apply()
+    """,
+    """
+    CREATE TRIGGER signals_stats_trg
+    AFTER INSERT OR DELETE OR UPDATE OF status, signal_type, oracle_score ON signals
+    FOR EACH ROW EXECUTE FUNCTION signal_stats_apply()
+    """,
+]
+
+DROP_ALL = [
+    "DROP TRIGGER IF EXISTS signals_stats_trg ON signals",
+    "DROP TRIGGER IF EXISTS users_stats_trg ON users",
+    "DROP FUNCTION IF EXISTS signal_stats_apply()",
+    "DROP FUNCTION IF EXISTS user_stats_apply()",
+    "DROP TABLE IF EXISTS signal_stats",
+    "DROP TABLE IF EXISTS user_stats",
+    "DROP INDEX IF EXISTS ix_users_created_at",
+]
+
+
+def install_stats_counters(conn):
+    """Create the counter tables and triggers; a no-op once the triggers exist"""
+    for stmt in CREATE_TABLES + CREATE_FUNCTIONS:
+        conn.execute(text(stmt))
+
+    installed = conn.execute(
+        text("SELECT COUNT(*) FROM pg_trigger WHERE tgname IN ('users_stats_trg', 'signals_stats_trg')")
+    ).scalar()
+    if installed == 2:
+        return
+
+    conn.execute(text("DROP TRIGGER IF EXISTS users_stats_trg ON users"))
+    conn.execute(text("DROP TRIGGER IF EXISTS signals_stats_trg ON signals"))
+    for stmt in INSTALL_TRIGGERS:
+        conn.execute(text(stmt))
+
+
+def drop_stats_counters(conn):
+    for stmt in DROP_ALL:
+        conn.execute(text(stmt))
@@ -1,11 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import settings
 from app.core.logging import logger, setup_logging
-from app.core.middleware import RequestLoggingMiddleware, RateLimitMiddleware
+from app.core.middleware import BodySizeLimitMiddleware, RequestLoggingMiddleware, RateLimitMiddleware
+from app.core.static import CachedStaticFiles, STATIC_DIR, STATIC_URL
 from app.core.exceptions import (
     AppException,
     app_exception_handler,
@@ -31,7 +33,12 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
+# Innermost, so it sees the endpoint's complete body and can honour minimum_size.
+# JSON list payloads are highly repetitive; small bodies aren't worth compressing.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 app.add_middleware(RateLimitMiddleware, requests_per_minute=100)
+# Chart screenshots are the largest bodies we accept
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=settings.MAX_UPLOAD_BYTES)
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -74,6 +81,8 @@ app.include_router(brokerage.router, prefix="/api/v1/brokerage", tags=["Brokerag
 # Admin UI
 app.include_router(admin_ui.router, prefix="/admin", tags=["Admin UI"])
 
+app.mount(STATIC_URL, CachedStaticFiles(directory=STATIC_DIR), name="static")
+
 @app.on_event("startup")
 async def startup_event():
     logger.info(f"🚀 Starting {settings.APP_NAME} v{settings.VERSION}")
@@ -93,6 +102,7 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     stop_scheduler()
+    await alerts.close_webhook_client()
 
 @app.get("/", tags=["Health"])
 async def root():
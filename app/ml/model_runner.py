@@ -6,6 +6,7 @@ Universal - works with any asset, any sector, any timeframe
 import os
 import random
 import urllib.request
+from functools import lru_cache
 from typing import Dict, List
 
 MODEL_PATH = os.getenv("CHART_MODEL_PATH", "/tmp/chart_classifier.pt")
@@ -148,6 +149,23 @@ def _simulate_outcomes(asset: str, timeframe: str) -> Dict:
     return result
 
 
+@lru_cache(maxsize=1)
+def _load_model():
+    """Load the TorchScript model and its preprocessing once per process"""
+    import torch
+    from torchvision import transforms
+    
+    transform = transforms.Compose([
+        transforms.Resize((224, 224)),
+        transforms.ToTensor(),
+        transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
+    ])
+    
+    model = torch.jit.load(MODEL_PATH, map_location=torch.device('cpu'))
+    model.eval()
+    return model, transform
+
+
 def run_inference(image_path: str, timeframe: str, asset: str) -> Dict:
     """
     Run chart pattern recognition on an image.
@@ -158,22 +176,11 @@ def run_inference(image_path: str, timeframe: str, asset: str) -> Dict:
     if download_model():
         try:
             import torch
-            from torchvision import transforms
             from PIL import Image
             
-            device = torch.device('cpu')
-            
-            transform = transforms.Compose([
-                transforms.Resize((224, 224)),
-                transforms.ToTensor(),
-                transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
-            ])
-            
+            model, transform = _load_model()
             img = Image.open(image_path).convert("RGB")
-            x = transform(img).unsqueeze(0).to(device)
-            
-            model = torch.jit.load(MODEL_PATH, map_location=device)
-            model.eval()
+            x = transform(img).unsqueeze(0)
             
             with torch.no_grad():
                 outputs = model(x)
@@ -1,5 +1,5 @@
 """Chart Analysis Model"""
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -9,7 +9,7 @@ class ChartAnalysis(Base):
     __tablename__ = "chart_analyses"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # Input
     asset = Column(String(50), nullable=False)
@@ -33,3 +33,8 @@ class ChartAnalysis(Base):
     # Metadata
     status = Column(String(20), default="active")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Serves the newest-first history page; the leading column covers user_id lookups
+    __table_args__ = (
+        Index('ix_chart_analyses_user_created', 'user_id', created_at.desc()),
+    )
@@ -2,7 +2,7 @@
 Signal Model - Trading signals from Lambda scanner
 Matches existing database schema
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, JSON, Index
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -63,5 +63,13 @@ class Signal(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     expires_at = Column(DateTime(timezone=True))
     
+    __table_args__ = (
+        Index('ix_signals_status_created', 'status', created_at.desc()),
+        Index('ix_signals_symbol_created', 'symbol', created_at.desc()),
+        # From 001_initial; declared so create_all databases get it too. A
+        # plain btree serves the DESC scans of the date-range reports as well
+        Index('ix_signals_created_at', 'created_at'),
+    )
+    
     def __repr__(self):
         return f"<Signal {self.symbol} {self.signal_type} @ {self.oracle_score}%>"
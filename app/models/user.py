@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON, Index, text
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -38,6 +38,15 @@ class User(Base):
 
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     last_login = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index('ix_users_tier_created', 'subscription_tier', created_at.desc()),
+        # Only users with a pending reset carry a token
+        Index(
+            'ix_users_reset_token', 'reset_token',
+            postgresql_where=text('reset_token IS NOT NULL'), sqlite_where=text('reset_token IS NOT NULL'),
+        ),
+    )
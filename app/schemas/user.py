@@ -1,15 +1,19 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, EmailStr
+from typing import Annotated, Optional
 from datetime import datetime
 
+# Emails are stored lowercased, so inputs are normalized during validation
+# and handlers can compare against users.email directly
+NormalizedEmail = Annotated[EmailStr, AfterValidator(str.lower)]
+
 class UserCreate(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
     password: str
     full_name: Optional[str] = None
     referral_code: Optional[str] = None
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
     password: str
 
 class UserResponse(BaseModel):
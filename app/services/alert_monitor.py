@@ -3,10 +3,10 @@ Alert Monitor Service
 Background job to check prices and trigger alerts
 """
 import httpx
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, or_
 from app.core.logging import logger
 
 
@@ -79,10 +79,13 @@ class AlertMonitor:
         
         triggered = []
         
-        # Get all active alerts
+        now = datetime.now(timezone.utc)
+        
+        # Get all active alerts that are out of cooldown
         alerts = db.query(AlertRule).filter(
             AlertRule.is_active == True,
-            AlertRule.trigger_type == "price"
+            AlertRule.trigger_type == "price",
+            or_(AlertRule.cooldown_until.is_(None), AlertRule.cooldown_until <= now)
         ).all()
         
         if not alerts:
@@ -102,19 +105,11 @@ class AlertMonitor:
         
         prices = {**crypto_prices, **stock_prices}
         
-        now = datetime.now(timezone.utc)
-        
         for alert in alerts:
             current_price = prices.get(alert.asset.upper())
             if not current_price:
                 continue
             
-            # Check cooldown
-            if alert.last_triggered:
-                cooldown_end = alert.last_triggered + timedelta(minutes=alert.cooldown_minutes)
-                if now < cooldown_end:
-                    continue
-            
             # Check condition
             if self.check_condition(current_price, alert.threshold, alert.condition):
                 # Get user info
@@ -139,7 +134,7 @@ class AlertMonitor:
                 })
                 
                 # Update alert state
-                alert.last_triggered = now
+                alert.start_cooldown(now)
                 alert.trigger_count += 1
         
         db.commit()
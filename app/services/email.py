@@ -1,4 +1,5 @@
 import os
+import asyncio
 from typing import Optional, List, Dict, Any
 import resend
 from app.core.config import settings
@@ -44,7 +45,8 @@ class EmailService:
             if text_content:
                 params["text"] = text_content
             
-            response = resend.Emails.send(params)
+            # The Resend SDK is blocking; keep it off the event loop so sends can overlap
+            response = await asyncio.to_thread(resend.Emails.send, params)
             email_id = response.get("id") if isinstance(response, dict) else None
             
             if email_id:
@@ -2,6 +2,7 @@
 Background Scheduler
 Run periodic jobs like alert monitoring
 """
+import asyncio
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime, timezone
@@ -44,6 +45,78 @@ async def generate_weekly_brief_job():
         db.close()
 
 
+async def scheduled_market_scan():
+    """Scan all supported assets and save actionable signals"""
+    from app.services.scanner import scanner
+    
+    db = SessionLocal()
+    try:
+        result = await scanner.scan_and_save(db)
+        logger.info("Market scan completed")
+        return result
+    except Exception as e:
+        logger.error(f"Market scan error: {e}")
+    finally:
+        db.close()
+
+
+async def cleanup_expired_signals():
+    """Mark active signals past their expiry time as expired"""
+    from sqlalchemy import update
+    from app.models.signal import Signal
+    
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            update(Signal)
+            .where(Signal.status == "active", Signal.expires_at < datetime.now(timezone.utc))
+            .values(status="expired")
+        )
+        db.commit()
+        logger.info(f"Expired {result.rowcount} signals")
+        return result.rowcount
+    except Exception as e:
+        logger.error(f"Signal cleanup error: {e}")
+    finally:
+        db.close()
+
+
+def _refresh_admin_stats():
+    from app.api.endpoints.admin import compute_dashboard_stats
+    
+    db = SessionLocal()
+    try:
+        compute_dashboard_stats(db)
+    finally:
+        db.close()
+
+
+async def refresh_admin_stats_job():
+    """Job to precompute admin dashboard stats before the cached copy expires"""
+    try:
+        await asyncio.to_thread(_refresh_admin_stats)
+    except Exception as e:
+        logger.error(f"Admin stats job error: {e}")
+
+
+def _refresh_rule_cache():
+    from app.api.endpoints.alerts import rule_cache
+    
+    db = SessionLocal()
+    try:
+        rule_cache.load(db)
+    finally:
+        db.close()
+
+
+async def refresh_rule_cache_job():
+    """Job to reload the in-memory alert rule snapshot"""
+    try:
+        await asyncio.to_thread(_refresh_rule_cache)
+    except Exception as e:
+        logger.error(f"Rule cache job error: {e}")
+
+
 def start_scheduler():
     """Start the background scheduler"""
     # Check alerts every 2 minutes
@@ -64,6 +137,25 @@ def start_scheduler():
         replace_existing=True
     )
     
+    # Keep the admin stats cache warm; runs a little inside its 60s TTL
+    scheduler.add_job(
+        refresh_admin_stats_job,
+        IntervalTrigger(seconds=50),
+        id="admin_stats",
+        name="Refresh admin dashboard stats",
+        replace_existing=True
+    )
+    
+    # Pick up alert rule changes made by other workers
+    from app.api.endpoints.alerts import RULE_CACHE_REFRESH_SECONDS
+    scheduler.add_job(
+        refresh_rule_cache_job,
+        IntervalTrigger(seconds=RULE_CACHE_REFRESH_SECONDS),
+        id="rule_cache",
+        name="Refresh alert rule cache",
+        replace_existing=True
+    )
+    
     scheduler.start()
     logger.info("Background scheduler started")
 
@@ -2,6 +2,7 @@
 Trade Intelligence Service V2 - Production Ready
 Institutional-grade AI-powered trade playbooks and chart analysis
 """
+import asyncio
 import httpx
 import json
 import os
@@ -16,6 +17,12 @@ class TradeIntelligenceService:
     """AI-powered trade analysis and playbook generation"""
     
     ANTHROPIC_API = "https://api.anthropic.com/v1/messages"
+    # Vision calls carry multi-MB payloads; cap how many one worker has in
+    # flight so a burst of uploads queues here instead of piling onto the API
+    MAX_CONCURRENT_IMAGE_CALLS = int(os.getenv("MAX_CONCURRENT_IMAGE_CALLS", "4"))
+    
+    def __init__(self):
+        self._image_slots = asyncio.Semaphore(self.MAX_CONCURRENT_IMAGE_CALLS)
     
     def _get_api_key(self) -> Optional[str]:
         """Get API key from environment"""
@@ -89,8 +96,8 @@ Now analyze {asset} at ${current_price:,.2f} and provide YOUR analysis with real
         """Analyze a chart image and return trade intelligence"""
         
         try:
-            with open(image_path, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
+            # Reading and encoding a large image would stall the event loop
+            image_data = await asyncio.to_thread(self._encode_image, image_path)
             media_type = "image/png" if image_path.lower().endswith(".png") else "image/jpeg"
         except Exception as e:
             logger.error(f"Failed to read image: {e}")
@@ -441,7 +448,13 @@ Return ONLY valid JSON with this structure:
 
 IMPORTANT: Only identify patterns you can clearly see. If no institutional pattern is present, set confidence below 50 and recommendation to WAIT."""
 
-        return await self._call_ai_with_image(prompt, image_data, media_type)
+        async with self._image_slots:
+            return await self._call_ai_with_image(prompt, image_data, media_type)
+    
+    @staticmethod
+    def _encode_image(image_path: str) -> str:
+        with open(image_path, "rb") as f:
+            return base64.b64encode(f.read()).decode("utf-8")
     
     async def _call_ai(self, prompt: str) -> Dict:
         """Call Anthropic API for text analysis"""
@@ -0,0 +1,278 @@
+const API_BASE = window.location.origin;
+// Storage is only touched on login/logout. Requests share header objects
+// that are rebuilt only when the token changes.
+let token = null;
+let _headers = null;
+let _jsonHeaders = null;
+setToken(localStorage.getItem('adminToken'));
+
+function setToken(value) {
+    token = value;
+    const auth = value ? `Bearer ${value}` : '';
+    _headers = Object.freeze({ 'Authorization': auth });
+    // Content-Type only goes out with a body
+    _jsonHeaders = Object.freeze({ 'Authorization': auth, 'Content-Type': 'application/json' });
+}
+
+// Elements rewritten on every refresh, looked up once in showDashboard
+const _ELEMENT_IDS = [
+    'totalUsers', 'proUsers', 'eliteUsers', 'mrr',
+    'totalSignals', 'activeSignals', 'signalsToday', 'avgScore',
+    'apiStatus', 'schedulerStatus', 'emailStatus', 'jobsList'
+];
+let _els = null;
+
+// Check if logged in
+if (token) {
+    showDashboard();
+}
+
+async function login() {
+    const email = document.getElementById('email').value;
+    const password = document.getElementById('password').value;
+
+    try {
+        const res = await fetch(`${API_BASE}/api/v1/auth/login`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ email, password })
+        });
+
+        const data = await res.json();
+
+        if (!data.access_token) {
+            showLoginError(data.detail || 'Login failed');
+            return;
+        }
+
+        // Refresh the session cookie that keeps /admin/ serving the dashboard
+        const session = await fetch(`${API_BASE}/api/v1/admin/session`, {
+            method: 'POST',
+            headers: { 'Authorization': `Bearer ${data.access_token}` }
+        });
+        if (!session.ok) {
+            showLoginError((await session.json()).detail || 'Login failed');
+            return;
+        }
+
+        setToken(data.access_token);
+        localStorage.setItem('adminToken', token);
+        showDashboard();
+    } catch (e) {
+        showLoginError('Connection error');
+    }
+}
+
+function showLoginError(msg) {
+    const el = document.getElementById('loginError');
+    el.textContent = msg;
+    el.style.display = 'block';
+}
+
+async function logout() {
+    localStorage.removeItem('adminToken');
+    setToken(null);
+    // Dropping the cookie makes the reload serve the login-only page
+    try {
+        await fetch(`${API_BASE}/api/v1/admin/session`, { method: 'DELETE' });
+    } finally {
+        location.reload();
+    }
+}
+
+async function showDashboard() {
+    document.getElementById('loginForm').style.display = 'none';
+    document.getElementById('dashboard').classList.add('active');
+    _els ??= Object.fromEntries(_ELEMENT_IDS.map(id => [id, document.getElementById(id)]));
+    if (location.hash) showTab(location.hash.slice(1), false);
+    // Independent requests: run them side by side, and don't let one failure drop the other
+    await Promise.allSettled([loadStats(), loadUsers()]);
+}
+
+async function apiCall(endpoint, method = 'GET', body = null) {
+    const res = await fetch(API_BASE + endpoint, body === null
+        ? { method, headers: _headers }
+        : { method, headers: _jsonHeaders, body: JSON.stringify(body) });
+    if (res.status === 403) {
+        // Parallel calls can all come back 403; only the first one logs out
+        if (token) {
+            alert('Admin access required');
+            logout();
+        }
+        return null;
+    }
+    return await res.json();
+}
+
+async function loadStats() {
+    const data = await apiCall('/api/v1/admin/stats');
+    if (!data) return;
+
+    _els.totalUsers.textContent = data.users.total;
+    _els.proUsers.textContent = data.users.by_tier.pro;
+    _els.eliteUsers.textContent = data.users.by_tier.elite;
+    _els.mrr.textContent = '$' + _numFmt.format(data.revenue.mrr);
+    _els.totalSignals.textContent = data.signals.total;
+    _els.activeSignals.textContent = data.signals.active;
+    _els.signalsToday.textContent = data.signals.today;
+    _els.avgScore.textContent = data.signals.avg_oracle_score;
+}
+
+// Built once: toLocale*String() sets up a fresh Intl formatter on every call.
+// Defaults match what those calls produced.
+const _dateFmt = new Intl.DateTimeFormat();
+const _dateTimeFmt = new Intl.DateTimeFormat(undefined, {
+    year: 'numeric', month: 'numeric', day: 'numeric',
+    hour: 'numeric', minute: 'numeric', second: 'numeric'
+});
+const _numFmt = new Intl.NumberFormat();
+
+// Rows are cloned from <template>s into a fragment and appended once,
+// so the HTML parser never runs per row and the table reflows once.
+function rowFromTemplate(id) {
+    return document.getElementById(id).content.firstElementChild;
+}
+
+// Loaded users and their rows, index-aligned, so search can filter in place
+let _users = [];
+let _userRows = [];
+let _searchTimer = null;
+
+async function loadUsers() {
+    const data = await apiCall('/api/v1/admin/users');
+    if (!data) return;
+
+    _users = data.users;
+    _userRows = [];
+    const tpl = rowFromTemplate('userRowTpl');
+    const frag = document.createDocumentFragment();
+    for (const u of data.users) {
+        const row = userRow(tpl, u);
+        _userRows.push(row);
+        frag.appendChild(row);
+    }
+    document.getElementById('usersTable').replaceChildren(frag);
+    filterUsers();
+}
+
+function userRow(tpl, u) {
+    u._search = (u.email + ' ' + (u.full_name || '')).toLowerCase();
+    const row = tpl.cloneNode(true);
+    row.querySelector('.id').textContent = u.id;
+    row.querySelector('.email').textContent = u.email;
+    row.querySelector('.name').textContent = u.full_name || '-';
+    const tier = row.querySelector('.tier-badge');
+    tier.classList.add(u.subscription_tier);
+    tier.textContent = u.subscription_tier;
+    const status = row.querySelector('.status-badge');
+    if (u.is_active) status.classList.add('active');
+    status.textContent = u.is_active ? 'Active' : 'Inactive';
+    row.querySelector('.joined').textContent = u.created_at ? _dateFmt.format(Date.parse(u.created_at)) : '-';
+    const select = row.querySelector('.tier-select');
+    select.value = u.subscription_tier;
+    select.onchange = () => updateTier(u.id, select.value);
+    return row;
+}
+
+async function loadSignals() {
+    const data = await apiCall('/api/v1/admin/signals');
+    if (!data) return;
+
+    const tpl = rowFromTemplate('signalRowTpl');
+    const frag = document.createDocumentFragment();
+    for (const s of data.signals) {
+        const row = tpl.cloneNode(true);
+        row.querySelector('.id').textContent = s.id;
+        row.querySelector('.symbol').textContent = s.symbol;
+        const type = row.querySelector('.type-badge');
+        type.classList.add(s.signal_type);
+        type.textContent = s.signal_type.toUpperCase();
+        row.querySelector('.score').textContent = s.oracle_score;
+        row.querySelector('.entry').textContent = '$' + _numFmt.format(s.entry_price);
+        row.querySelector('.target').textContent = '$' + _numFmt.format(s.target_price);
+        const status = row.querySelector('.status-badge');
+        status.classList.add(s.status);
+        status.textContent = s.status;
+        row.querySelector('.created').textContent = _dateFmt.format(Date.parse(s.created_at));
+        frag.appendChild(row);
+    }
+    document.getElementById('signalsTable').replaceChildren(frag);
+}
+
+async function loadSystemHealth() {
+    const data = await apiCall('/api/v1/admin/system/health');
+    if (!data) return;
+
+    _els.apiStatus.textContent = data.api;
+    _els.schedulerStatus.textContent = data.scheduler.status;
+    _els.emailStatus.textContent = data.email.enabled ? 'Enabled' : 'Disabled';
+    _els.emailStatus.classList.toggle('green', data.email.enabled);
+
+    const tpl = rowFromTemplate('jobRowTpl');
+    const frag = document.createDocumentFragment();
+    for (const j of data.scheduler.jobs) {
+        const row = tpl.cloneNode(true);
+        row.querySelector('.name').textContent = j.name;
+        row.querySelector('.next').textContent = j.next_run ? _dateTimeFmt.format(Date.parse(j.next_run)) : 'N/A';
+        frag.appendChild(row);
+    }
+    _els.jobsList.replaceChildren(frag);
+}
+
+async function updateTier(userId, tier) {
+    const data = await apiCall(`/api/v1/admin/users/${userId}/tier?tier=${tier}`, 'PATCH');
+    // Stats refresh on their own; only the changed row is rebuilt
+    loadStats();
+    const i = _users.findIndex(u => u.id === userId);
+    if (!data || !data.user || i === -1) return;
+
+    const row = userRow(rowFromTemplate('userRowTpl'), data.user);
+    row.hidden = _userRows[i].hidden;
+    _userRows[i].replaceWith(row);
+    _users[i] = data.user;
+    _userRows[i] = row;
+}
+
+async function triggerScan() {
+    const data = await apiCall('/api/v1/admin/system/scan', 'POST');
+    if (data) {
+        alert('Scan started. New signals will appear once it finishes.');
+        await Promise.allSettled([loadStats(), loadSignals()]);
+    }
+}
+
+async function triggerCleanup() {
+    const data = await apiCall('/api/v1/admin/system/cleanup', 'POST');
+    if (data) {
+        alert('Cleanup started.');
+        await Promise.allSettled([loadStats(), loadSignals()]);
+    }
+}
+
+// Tabs are client-side only: the URL hash records the open tab so
+// back/forward and reloads work without asking the server for anything.
+function showTab(tab, push = true) {
+    const section = document.getElementById(tab + 'Section');
+    if (!section) return;
+
+    for (const t of document.querySelectorAll('.tab')) t.classList.toggle('active', t.dataset.tab === tab);
+    for (const s of document.querySelectorAll('.section')) s.hidden = s !== section;
+    if (push && location.hash !== '#' + tab) history.pushState({ tab }, '', '#' + tab);
+
+    if (tab === 'signals') loadSignals();
+    if (tab === 'system') loadSystemHealth();
+}
+
+window.addEventListener('popstate', () => showTab(location.hash.slice(1) || 'users', false));
+
+function searchUsers() {
+    clearTimeout(_searchTimer);
+    _searchTimer = setTimeout(filterUsers, 100);
+}
+
+function filterUsers() {
+    const q = document.getElementById('userSearch').value.trim().toLowerCase();
+    for (let i = 0; i < _userRows.length; i++) {
+        _userRows[i].hidden = q !== '' && !_users[i]._search.includes(q);
+    }
+}
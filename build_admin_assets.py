@@ -0,0 +1,26 @@
+"""
+Minify the admin dashboard assets.
+
+Run after editing app/static/admin/admin.css or admin.js and commit the
+generated .min files; the app serves those and never minifies at runtime.
+
+    pip install rcssmin rjsmin
+    python build_admin_assets.py
+"""
+from pathlib import Path
+
+import rcssmin
+import rjsmin
+
+ADMIN_STATIC = Path(__file__).resolve().parent / "app" / "static" / "admin"
+
+MINIFIERS = {
+    "admin.css": ("admin.min.css", rcssmin.cssmin),
+    "admin.js": ("admin.min.js", rjsmin.jsmin),
+}
+
+for source, (target, minify) in MINIFIERS.items():
+    text = (ADMIN_STATIC / source).read_text(encoding="utf-8")
+    minified = minify(text).strip() + "\n"
+    (ADMIN_STATIC / target).write_text(minified, encoding="utf-8")
+    print(f"{source}: {len(text)} -> {len(minified)} bytes")
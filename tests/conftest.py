@@ -30,6 +30,8 @@ def db():
 
 @pytest.fixture(scope="function")
 def client(db):
+    # Rebuild the middleware stack so in-memory rate limit counters start empty
+    app.middleware_stack = None
     return TestClient(app)
 
 @pytest.fixture
@@ -0,0 +1,187 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from app.api.endpoints import admin
+from app.db import stats_counters
+from app.models.signal import Signal
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def reset_admin_caches():
+    admin._admin_cache.clear()
+    admin._invalidate_stats_cache()
+
+
+@pytest.fixture
+def admin_headers(client, db, auth_headers, test_user_data):
+    db.query(User).filter(User.email == test_user_data["email"]).update({"is_admin": True})
+    db.commit()
+    return auth_headers
+
+
+class TestAdmin:
+    def test_stats_requires_admin(self, client, auth_headers):
+        response = client.get("/api/v1/admin/stats", headers=auth_headers)
+        assert response.status_code == 403
+
+    def test_stats(self, client, admin_headers):
+        response = client.get("/api/v1/admin/stats", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["users"]["total"] == 1
+        assert data["users"]["by_tier"]["lite"] == 1
+        assert data["users"]["new_this_week"] == 1
+        assert data["signals"]["total"] == 0
+
+    def test_stats_cache_invalidated_on_tier_change(self, client, db, admin_headers, test_user_data):
+        client.get("/api/v1/admin/stats", headers=admin_headers)
+        user = db.query(User).filter(User.email == test_user_data["email"]).first()
+
+        response = client.patch(f"/api/v1/admin/users/{user.id}/tier?tier=pro", headers=admin_headers)
+        assert response.status_code == 200
+
+        data = client.get("/api/v1/admin/stats", headers=admin_headers).json()
+        assert data["users"]["by_tier"]["pro"] == 1
+        assert data["revenue"]["mrr"] == 98
+
+    def test_list_users_total(self, client, admin_headers):
+        response = client.get("/api/v1/admin/users", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert len(data["users"]) == 1
+        assert data["users"][0]["created_at"].startswith(str(datetime.now().year))
+
+        data = client.get("/api/v1/admin/users?page=5", headers=admin_headers).json()
+        assert data["users"] == []
+        assert data["total"] == 1
+
+    def test_list_signals(self, client, db, admin_headers):
+        db.add(Signal(symbol="BTC", pair="BTC/USD", signal_type="BUY", oracle_score=80, status="active"))
+        db.commit()
+
+        data = client.get("/api/v1/admin/signals?status=active", headers=admin_headers).json()
+        assert data["total"] == 1
+        assert data["signals"][0]["symbol"] == "BTC"
+        assert "input_snapshot" not in data["signals"][0]
+
+    def test_broadcast_counts_successful_sends(self, client, admin_headers, monkeypatch):
+        from app.services.email import email_service
+
+        async def fake_send(to_email, subject, html_content, text_content=None):
+            return True
+
+        monkeypatch.setattr(email_service, "enabled", True)
+        monkeypatch.setattr(email_service, "send_email", fake_send)
+
+        response = client.post("/api/v1/admin/system/broadcast?subject=Hi&message=Hello", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["total_recipients"] == 1
+        assert response.json()["message"] == "Broadcast sent to 1 users"
+
+    def test_system_health_reports_pool(self, client, admin_headers):
+        response = client.get("/api/v1/admin/system/health", headers=admin_headers)
+        assert response.status_code == 200
+        assert "checked_out" in response.json()["database_pool"]
+
+    def test_update_tier_reports_old_tier(self, client, db, admin_headers, test_user_data):
+        user = db.query(User).filter(User.email == test_user_data["email"]).first()
+        data = client.patch(f"/api/v1/admin/users/{user.id}/tier?tier=elite", headers=admin_headers).json()
+        assert data["old_tier"] == "lite"
+        assert data["new_tier"] == "elite"
+        assert data["user"]["subscription_tier"] == "elite"
+        assert data["user"]["email"] == test_user_data["email"]
+        assert "hashed_password" not in data["user"]
+
+        response = client.patch("/api/v1/admin/users/999999/tier?tier=pro", headers=admin_headers)
+        assert response.status_code == 404
+
+    def test_toggle_user_status(self, client, db, admin_headers, test_user_data):
+        user = db.query(User).filter(User.email == test_user_data["email"]).first()
+        data = client.patch(f"/api/v1/admin/users/{user.id}/status", headers=admin_headers).json()
+        assert data["is_active"] is False
+
+    def test_update_tier_rejects_unknown_tier(self, client, db, admin_headers, test_user_data):
+        user = db.query(User).filter(User.email == test_user_data["email"]).first()
+        response = client.patch(f"/api/v1/admin/users/{user.id}/tier?tier=free", headers=admin_headers)
+        assert response.status_code == 422
+
+    def test_counter_stats_match_scan(self, db, admin_headers):
+        db.add(Signal(symbol="ETH", signal_type="buy", oracle_score=70, status="active"))
+        db.commit()
+        for stmt in stats_counters.CREATE_TABLES:
+            db.execute(text(stmt))
+        db.execute(text("DELETE FROM user_stats"))
+        db.execute(text("DELETE FROM signal_stats"))
+        db.execute(text("INSERT INTO user_stats VALUES ('lite', 1, 1)"))
+        db.execute(text("INSERT INTO signal_stats VALUES ('active', 'buy', 1, 70, 1)"))
+
+        week_ago = datetime.utcnow() - timedelta(days=7)
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        counted = admin._counter_stats(db, week_ago, today)._asdict()
+        scanned = admin._scan_stats(db, week_ago, today)._asdict()
+        db.execute(text("DROP TABLE user_stats"))
+        db.execute(text("DROP TABLE signal_stats"))
+        db.commit()
+
+        assert counted == scanned
+
+    def test_update_signal_status_computes_pnl(self, client, db, admin_headers):
+        signal = Signal(symbol="BTC", signal_type="buy", entry_price=100.0, status="active")
+        db.add(signal)
+        db.commit()
+
+        response = client.patch(
+            f"/api/v1/admin/signals/{signal.id}/status?status=hit_target&outcome_price=110",
+            headers=admin_headers,
+        )
+        assert response.status_code == 200
+        db.refresh(signal)
+        assert signal.status == "hit_target"
+        assert signal.outcome_pnl_percent == pytest.approx(10.0)
+
+        response = client.patch("/api/v1/admin/signals/999999/status?status=expired", headers=admin_headers)
+        assert response.status_code == 404
+
+    def test_delete_signal(self, client, db, admin_headers):
+        signal = Signal(symbol="BTC", signal_type="sell", status="active")
+        db.add(signal)
+        db.commit()
+
+        assert client.delete(f"/api/v1/admin/signals/{signal.id}", headers=admin_headers).status_code == 200
+        assert client.delete(f"/api/v1/admin/signals/{signal.id}", headers=admin_headers).status_code == 404
+
+    def test_deactivated_admin_loses_access(self, client, db, admin_headers, test_user_data):
+        user = db.query(User).filter(User.email == test_user_data["email"]).first()
+        assert client.get("/api/v1/admin/stats", headers=admin_headers).status_code == 200
+
+        client.patch(f"/api/v1/admin/users/{user.id}/status", headers=admin_headers)
+        assert client.get("/api/v1/admin/stats", headers=admin_headers).status_code == 403
+
+    def test_get_user(self, client, db, admin_headers, test_user_data):
+        user = db.query(User).filter(User.email == test_user_data["email"]).first()
+        data = client.get(f"/api/v1/admin/users/{user.id}", headers=admin_headers).json()
+        assert data["email"] == test_user_data["email"]
+        assert "hashed_password" not in data
+
+        assert client.get("/api/v1/admin/users/999999", headers=admin_headers).status_code == 404
+
+    def test_cleanup_runs_in_background(self, client, db, admin_headers, monkeypatch):
+        from sqlalchemy.orm import sessionmaker
+        from app.services import scheduler
+
+        # Background jobs open their own session rather than using get_db
+        monkeypatch.setattr(scheduler, "SessionLocal", sessionmaker(bind=db.get_bind()))
+        signal = Signal(
+            symbol="BTC", signal_type="buy", status="active",
+            expires_at=datetime.utcnow() - timedelta(hours=1),
+        )
+        db.add(signal)
+        db.commit()
+
+        response = client.post("/api/v1/admin/system/cleanup", headers=admin_headers)
+        assert response.status_code == 202
+
+        db.refresh(signal)
+        assert signal.status == "expired"
@@ -0,0 +1,139 @@
+import pytest
+from app.api.endpoints import admin
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+@pytest.fixture
+def session_headers():
+    return {"Cookie": f"admin_session={create_access_token(1)}"}
+
+
+class TestAdminUI:
+    def test_dashboard_served(self, client, session_headers):
+        response = client.get("/admin/", headers=session_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert "ELUXRAJ Admin" in response.text
+        assert 'id="dashboard"' in response.text
+
+    def test_login_shell_without_session(self, client, session_headers):
+        full = client.get("/admin/", headers=session_headers)
+        for headers in ({}, {"Cookie": "admin_session=forged"}):
+            response = client.get("/admin/", headers=headers)
+            assert response.status_code == 200
+            assert 'id="loginForm"' in response.text
+            assert 'id="dashboard"' not in response.text
+            assert len(response.content) < len(full.content)
+            assert response.headers["etag"] != full.headers["etag"]
+
+    def test_session_requires_admin(self, client, db, auth_headers, test_user_data):
+        admin._admin_cache.clear()
+        assert client.post("/api/v1/admin/session", headers=auth_headers).status_code == 403
+
+        db.query(User).filter(User.email == test_user_data["email"]).update({"is_admin": True})
+        db.commit()
+        response = client.post("/api/v1/admin/session", headers=auth_headers)
+        assert response.status_code == 200
+        cookie = response.headers["set-cookie"]
+        assert cookie.startswith("admin_session=")
+        assert "HttpOnly" in cookie and "Path=/admin" in cookie
+
+        session = cookie.split(";")[0]
+        assert 'id="dashboard"' in client.get("/admin/", headers={"Cookie": session}).text
+
+    def test_dashboard_renders_settings_in_debug(self, client, session_headers, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "DEBUG", True)
+        monkeypatch.setattr(settings, "ADMIN_TITLE", "Ops <Console>")
+        html = client.get("/admin/", headers=session_headers).text
+        assert "<title>Ops &lt;Console&gt;</title>" in html
+        assert "{{" not in html
+
+        monkeypatch.setattr(settings, "DEBUG", False)
+        assert "<title>ELUXRAJ Admin</title>" in client.get("/admin/").text
+
+    def test_reload_ui_rereads_templates(self, client, db, auth_headers, test_user_data, monkeypatch, tmp_path):
+        from app.api.endpoints import admin_ui
+
+        admin._admin_cache.clear()
+        db.query(User).filter(User.email == test_user_data["email"]).update({"is_admin": True})
+        db.commit()
+        edited = tmp_path / "login.html"
+        edited.write_bytes(admin_ui._LOGIN_PAGE.read_bytes().replace(b"<body>", b"<body><p>Edited</p>"))
+        monkeypatch.setattr(admin_ui, "_LOGIN_PAGE", edited)
+        assert "<p>Edited</p>" not in client.get("/admin/").text
+
+        assert client.post("/api/v1/admin/system/reload-ui", headers=auth_headers).status_code == 200
+        assert "<p>Edited</p>" in client.get("/admin/").text
+
+        monkeypatch.undo()
+        client.post("/api/v1/admin/system/reload-ui", headers=auth_headers)
+        assert "<p>Edited</p>" not in client.get("/admin/").text
+
+    def test_dashboard_not_modified(self, client):
+        etag = client.get("/admin/").headers["etag"]
+
+        response = client.get("/admin/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = client.get("/admin/", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+
+    def test_dashboard_last_modified(self, client):
+        response = client.get("/admin/")
+        assert response.headers["cache-control"].startswith("private, max-age=300")
+        last_modified = response.headers["last-modified"]
+
+        response = client.get("/admin/", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+        old = "Mon, 01 Jan 2001 00:00:00 GMT"
+        assert client.get("/admin/", headers={"If-Modified-Since": old}).status_code == 200
+        assert client.get("/admin/", headers={"If-Modified-Since": "garbage"}).status_code == 200
+        # A mismatched ETag wins over a matching date
+        response = client.get("/admin/", headers={"If-Modified-Since": last_modified, "If-None-Match": '"stale"'})
+        assert response.status_code == 200
+
+    def test_dashboard_precompressed(self, client):
+        response = client.get("/admin/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding, Cookie"
+        assert "ELUXRAJ Admin" in response.text
+
+        response = client.get("/admin/", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+
+    def test_shared_response_headers_not_mutated(self, client, session_headers):
+        # GZipMiddleware still compresses this one; that must not leak into later responses
+        response = client.get("/admin/", headers={**session_headers, "Accept-Encoding": "gzip;q=0"})
+        assert response.status_code == 200
+
+        response = client.get("/admin/", headers={**session_headers, "Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert 'id="dashboard"' in response.text
+
+    def test_dashboard_assets_are_versioned(self, client, session_headers):
+        html = client.get("/admin/", headers=session_headers).text
+        assert "<style>" not in html
+        css_url = html.split('<link rel="stylesheet" href="')[1].split('"')[0]
+        js_url = html.split('<script src="')[1].split('"')[0]
+
+        for url in (css_url, js_url):
+            assert "?v=" in url
+            response = client.get(url)
+            assert response.status_code == 200
+            assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+        link = client.get("/admin/", headers=session_headers).headers["link"]
+        assert f"<{css_url}>; rel=preload; as=style" in link
+        assert f"<{js_url}>; rel=preload; as=script" in link
+
+        # The login page shares the dashboard's cached stylesheet
+        login_html = client.get("/admin/").text
+        assert "<style>" not in login_html
+        assert f'href="{css_url}"' in login_html
+
+        assert "immutable" not in client.get("/static/admin/admin.css").headers.get("cache-control", "")
@@ -0,0 +1,217 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from app.core import deps
+from app.api.endpoints.alerts import (
+    AlertHistory, AlertRule, NotificationChannel, check_and_trigger_alerts, cooldown_jitter, rule_cache,
+)
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def reset_rule_cache():
+    rule_cache.clear()
+    deps._active_user_cache.clear()
+
+
+class TestAlerts:
+    def test_check_and_trigger_alerts(self, db):
+        db.add_all([User(id=i, email=f"user{i}@example.com", hashed_password="x") for i in range(1, 5)])
+        db.add_all([
+            AlertRule(user_id=1, name="above", asset="BTC", trigger_type="price", condition="above", threshold=90),
+            AlertRule(user_id=2, name="below", asset="BTC", trigger_type="price", condition="below", threshold=200),
+            AlertRule(user_id=3, name="miss", asset="BTC", trigger_type="price", condition="above", threshold=500),
+            AlertRule(user_id=4, name="off", asset="BTC", trigger_type="price", condition="above", threshold=1, is_active=False),
+        ])
+        db.commit()
+
+        asyncio.run(check_and_trigger_alerts("BTC", "price", 100.0, db))
+
+        alerts = db.query(AlertHistory).order_by(AlertHistory.user_id).all()
+        assert [a.user_id for a in alerts] == [1, 2]
+        assert all(a.notification_sent for a in alerts)
+        assert NotificationChannel.names(alerts[0].notification_channels) == ["email", "push"]
+        pushed = AlertHistory.notification_channels.op("&")(NotificationChannel.PUSH) != 0
+        assert db.query(AlertHistory).filter(pushed).count() == 2
+
+        counts = dict(db.query(AlertRule.name, AlertRule.trigger_count).all())
+        assert counts == {"above": 1, "below": 1, "miss": 0, "off": 0}
+
+        # Both fired rules are now cooling down
+        asyncio.run(check_and_trigger_alerts("BTC", "price", 100.0, db))
+        assert db.query(AlertHistory).count() == 2
+
+    def test_trigger_selects_do_not_scale_with_alerts(self, db):
+        from sqlalchemy import event
+
+        db.add_all([User(id=i, email=f"user{i}@example.com", hashed_password="x") for i in range(1, 6)])
+        db.add_all([
+            AlertRule(user_id=i, name=f"r{i}", asset="ETH", trigger_type="price", condition="above", threshold=1)
+            for i in range(1, 6)
+        ])
+        db.commit()
+        rule_cache.load(db)
+
+        selects = []
+        engine = db.get_bind()
+        listener = lambda conn, cursor, stmt, *args: stmt.startswith("SELECT") and selects.append(stmt)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            asyncio.run(check_and_trigger_alerts("ETH", "price", 10.0, db))
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        # Matching is served from the rule cache; only the fired rules are
+        # loaded, plus one reload each for alerts and rules/users
+        assert len(selects) == 3
+
+    def test_rule_endpoints_update_cache(self, client, db, auth_headers):
+        rule_cache.load(db)
+        payload = {"name": "btc", "asset": "btc", "trigger_type": "price", "condition": "above", "threshold": 5}
+        rule_id = client.post("/api/v1/alerts/rules", json=payload, headers=auth_headers).json()["rule_id"]
+        assert [r.id for r in rule_cache.get(db, "BTC", "price")] == [rule_id]
+
+        client.patch(f"/api/v1/alerts/rules/{rule_id}", json={"threshold": 7}, headers=auth_headers)
+        assert rule_cache.get(db, "BTC", "price")[0].threshold == 7
+        assert db.query(AlertRule.threshold).filter(AlertRule.id == rule_id).scalar() == 7
+        assert client.patch(f"/api/v1/alerts/rules/{rule_id}", json={}, headers=auth_headers).status_code == 200
+        assert client.patch("/api/v1/alerts/rules/999999", json={"threshold": 7}, headers=auth_headers).status_code == 404
+
+        client.patch(f"/api/v1/alerts/rules/{rule_id}", json={"is_active": False}, headers=auth_headers)
+        assert rule_cache.get(db, "BTC", "price") == []
+
+        client.patch(f"/api/v1/alerts/rules/{rule_id}", json={"is_active": True}, headers=auth_headers)
+        client.delete(f"/api/v1/alerts/rules/{rule_id}", headers=auth_headers)
+        assert rule_cache.get(db, "BTC", "price") == []
+
+    def test_changing_cooldown_moves_cooldown_end(self, client, db, auth_headers):
+        rule_cache.load(db)
+        payload = {"name": "btc", "asset": "btc", "trigger_type": "price", "condition": "above", "threshold": 5}
+        rule_id = client.post("/api/v1/alerts/rules", json=payload, headers=auth_headers).json()["rule_id"]
+        client.patch(f"/api/v1/alerts/rules/{rule_id}", json={"cooldown_minutes": 30}, headers=auth_headers)
+        # Never triggered, so there is no cooldown to move
+        assert db.query(AlertRule.cooldown_until).filter(AlertRule.id == rule_id).scalar() is None
+
+        triggered = datetime(2026, 1, 1, 12, 0)
+        rule = db.get(AlertRule, rule_id)
+        rule.start_cooldown(triggered)
+        db.commit()
+
+        client.patch(f"/api/v1/alerts/rules/{rule_id}", json={"cooldown_minutes": 5}, headers=auth_headers)
+        db.expire_all()
+        expected = triggered + timedelta(minutes=5) + cooldown_jitter(rule_id)
+        assert db.get(AlertRule, rule_id).cooldown_until == expected
+        assert rule_cache.get(db, "BTC", "price")[0].cooldown_until == expected
+
+    def test_scan_fetches_assets_concurrently(self, client, db, auth_headers, monkeypatch):
+        from sqlalchemy.orm import sessionmaker
+        from app.api.endpoints import alerts
+        from app.services.oracle import oracle
+
+        # The scan runs as a background task with its own session
+        monkeypatch.setattr(alerts, "SessionLocal", sessionmaker(bind=db.get_bind()))
+
+        running, peak = 0, 0
+
+        async def fake_generate_signal(symbol):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if symbol == "BAD":
+                raise RuntimeError("provider down")
+            return {"oracle_score": 60, "signal_type": "buy", "entry_price": 1.0}
+
+        monkeypatch.setattr(oracle, "generate_signal", fake_generate_signal)
+
+        response = client.post("/api/v1/alerts/scan", json=["BTC", "BAD", "ETH"], headers=auth_headers)
+        assert response.status_code == 202
+        assert peak == 3
+
+        scans = client.get("/api/v1/alerts/scan/history", headers=auth_headers).json()["scans"]
+        assert [r["asset"] for r in scans[0]["signals"]] == ["BTC", "ETH"]
+
+    def test_test_notification_is_queued(self, client, db, auth_headers, monkeypatch):
+        from sqlalchemy.orm import sessionmaker
+        from app.api.endpoints import alerts
+
+        monkeypatch.setattr(alerts, "SessionLocal", sessionmaker(bind=db.get_bind()))
+        payload = {"name": "btc", "asset": "btc", "trigger_type": "price", "condition": "above",
+                   "threshold": 5, "notify_email": False, "notify_push": False}
+        rule_id = client.post("/api/v1/alerts/rules", json=payload, headers=auth_headers).json()["rule_id"]
+
+        response = client.post(f"/api/v1/alerts/test/{rule_id}", headers=auth_headers)
+        assert response.status_code == 202
+        assert response.json()["channels"] == []
+        assert db.query(AlertHistory).filter(AlertHistory.rule_id == rule_id).count() == 1
+
+        assert client.post("/api/v1/alerts/test/999999", headers=auth_headers).status_code == 404
+
+    def test_cooldown_end_is_offset_per_rule(self, db):
+        from datetime import datetime, timedelta, timezone
+
+        db.add(User(id=1, email="user1@example.com", hashed_password="x"))
+        rule = AlertRule(id=30, user_id=1, name="jit", asset="SOL", trigger_type="price", condition="above", threshold=1)
+        # The 60 minute cooldown ended 10s ago, but rule 30 waits another 30s
+        rule.cooldown_minutes = 60
+        rule.start_cooldown(datetime.now(timezone.utc) - timedelta(minutes=60, seconds=10))
+        db.add(rule)
+        db.commit()
+
+        rule_cache.load(db)
+        asyncio.run(check_and_trigger_alerts("SOL", "price", 10.0, db))
+        assert db.query(AlertHistory).count() == 0
+
+        # A stale cache entry is still caught by the cooldown filter in SQL
+        rule_cache.put(AlertRule(id=30, asset="SOL", trigger_type="price", condition="above", threshold=1, is_active=True))
+        asyncio.run(check_and_trigger_alerts("SOL", "price", 10.0, db))
+        assert db.query(AlertHistory).count() == 0
+
+    def test_list_endpoints_serialize_rows(self, client, db, auth_headers):
+        payload = {"name": "btc", "asset": "btc", "trigger_type": "price", "condition": "above", "threshold": 5}
+        rule_id = client.post("/api/v1/alerts/rules", json=payload, headers=auth_headers).json()["rule_id"]
+        user_id = db.query(AlertRule.user_id).filter(AlertRule.id == rule_id).scalar()
+
+        rules = client.get("/api/v1/alerts/rules", headers=auth_headers).json()["rules"]
+        assert rules[0]["asset"] == "BTC"
+        assert rules[0]["last_triggered"] is None
+
+        db.add(AlertHistory(
+            rule_id=rule_id, user_id=user_id, asset="BTC", trigger_type="price",
+            trigger_value=6, threshold=5, message="hit",
+        ))
+        db.commit()
+        data = client.get("/api/v1/alerts/history", headers=auth_headers).json()
+        assert data["count"] == 1
+        assert data["alerts"][0]["message"] == "hit"
+        assert data["alerts"][0]["triggered_at"].startswith("20")
+
+    def test_concurrent_trigger_is_logged_once(self, db):
+        from datetime import datetime, timezone
+
+        now = datetime.now(timezone.utc)
+        db.add(User(id=1, email="user1@example.com", hashed_password="x"))
+        db.add(AlertRule(id=7, user_id=1, name="race", asset="ADA", trigger_type="price", condition="above", threshold=1))
+        # Another scan already logged this rule in the current minute
+        db.add(AlertHistory(
+            rule_id=7, user_id=1, asset="ADA", trigger_type="price", trigger_value=2, threshold=1,
+            message="first", trigger_bucket=now.replace(second=0, microsecond=0),
+        ))
+        db.commit()
+
+        asyncio.run(check_and_trigger_alerts("ADA", "price", 2.0, db, now))
+        assert db.query(AlertHistory).count() == 1
+        assert db.query(AlertRule.trigger_count).filter(AlertRule.id == 7).scalar() == 0
+
+    def test_deactivated_user_loses_access(self, client, db, auth_headers, test_user_data):
+        assert client.get("/api/v1/alerts/rules", headers=auth_headers).status_code == 200
+
+        # Flipped behind the cache's back, so the cached id still gets through
+        db.query(User).filter(User.email == test_user_data["email"]).update({"is_active": False})
+        db.commit()
+        assert client.get("/api/v1/alerts/rules", headers=auth_headers).status_code == 200
+
+        user_id = db.query(User.id).filter(User.email == test_user_data["email"]).scalar()
+        deps.invalidate_active_user(user_id)
+        assert client.get("/api/v1/alerts/rules", headers=auth_headers).status_code == 403
@@ -1,4 +1,14 @@
 import pytest
+from app.api.endpoints import auth
+from app.core import security
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def reset_me_cache():
+    auth._me_cache.clear()
+    security._token_cache.clear()
+
 
 class TestAuth:
     def test_register_success(self, client, test_user_data):
@@ -17,6 +27,27 @@ class TestAuth:
         response = client.post("/api/v1/auth/register", json=test_user_data)
         assert response.status_code == 400
         assert "already registered" in response.json()["detail"]
+
+    def test_only_email_conflicts_count_as_duplicates(self, db):
+        from sqlalchemy.exc import IntegrityError
+
+        db.add_all([
+            User(email="a@example.com", hashed_password="x", referral_code="SAME"),
+            User(email="b@example.com", hashed_password="x", referral_code="SAME"),
+        ])
+        with pytest.raises(IntegrityError) as exc:
+            db.flush()
+        db.rollback()
+        assert not auth._is_duplicate_email(exc.value)
+
+        db.add_all([
+            User(email="c@example.com", hashed_password="x"),
+            User(email="c@example.com", hashed_password="x"),
+        ])
+        with pytest.raises(IntegrityError) as exc:
+            db.flush()
+        db.rollback()
+        assert auth._is_duplicate_email(exc.value)
     
     def test_register_invalid_email(self, client):
         response = client.post("/api/v1/auth/register", json={
@@ -39,6 +70,16 @@ class TestAuth:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
     
+    def test_email_is_case_insensitive(self, client, test_user_data):
+        response = client.post("/api/v1/auth/register", json={**test_user_data, "email": "Test@Example.COM"})
+        assert response.json()["email"] == "test@example.com"
+        
+        response = client.post("/api/v1/auth/login", json={
+            "email": "TEST@example.com",
+            "password": test_user_data["password"]
+        })
+        assert response.status_code == 200
+    
     def test_login_wrong_password(self, client, test_user_data):
         client.post("/api/v1/auth/register", json=test_user_data)
         
@@ -71,3 +112,91 @@ class TestAuth:
             headers={"Authorization": "Bearer invalid_token"}
         )
         assert response.status_code == 401
+    
+    def test_update_me(self, client, auth_headers, test_user_data):
+        response = client.patch("/api/v1/auth/me", json={"full_name": "New Name", "push_alerts": False}, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["full_name"] == "New Name"
+        assert data["push_alerts"] is False
+        assert data["email_alerts"] is True
+        
+        data = client.get("/api/v1/auth/me", headers=auth_headers).json()
+        assert data["full_name"] == "New Name"
+        assert data["push_alerts"] is False
+    
+    def test_get_me_is_cached_until_profile_changes(self, client, db, auth_headers, test_user_data):
+        assert client.get("/api/v1/auth/me", headers=auth_headers).json()["full_name"] == "Test User"
+        
+        # A write that bypasses the API is not seen until the entry expires
+        db.query(User).filter(User.email == test_user_data["email"]).update({"full_name": "Direct"})
+        db.commit()
+        assert client.get("/api/v1/auth/me", headers=auth_headers).json()["full_name"] == "Test User"
+        
+        client.patch("/api/v1/auth/me", json={"email_alerts": False}, headers=auth_headers)
+        data = client.get("/api/v1/auth/me", headers=auth_headers).json()
+        assert data["full_name"] == "Direct"
+        assert data["email_alerts"] is False
+    
+    def test_login_upgrades_bcrypt_hash(self, client, db):
+        from passlib.hash import bcrypt
+        db.add(User(email="legacy@example.com", hashed_password=bcrypt.hash("OldPass123!"), is_active=True))
+        db.commit()
+        
+        response = client.post("/api/v1/auth/login", json={"email": "legacy@example.com", "password": "OldPass123!"})
+        assert response.status_code == 200
+        
+        db.expire_all()
+        stored = db.query(User.hashed_password).filter(User.email == "legacy@example.com").scalar()
+        assert stored.startswith("$argon2id$")
+        
+        response = client.post("/api/v1/auth/login", json={"email": "legacy@example.com", "password": "OldPass123!"})
+        assert response.status_code == 200
+    
+    def test_login_loads_only_credential_columns(self, client, db, test_user_data):
+        from sqlalchemy import event
+        client.post("/api/v1/auth/register", json=test_user_data)
+        
+        selects = []
+        engine = db.get_bind()
+        listener = lambda conn, cursor, stmt, *args: stmt.startswith("SELECT") and selects.append(stmt)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            response = client.post("/api/v1/auth/login", json={
+                "email": test_user_data["email"],
+                "password": test_user_data["password"]
+            })
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        
+        assert response.status_code == 200
+        assert len(selects) == 1
+        assert "full_name" not in selects[0]
+    
+    def test_reset_token_is_single_use(self, client, db, auth_headers, test_user_data):
+        db.query(User).filter(User.email == test_user_data["email"]).update({"reset_token": "tok"})
+        db.commit()
+        
+        body = {"token": "tok", "new_password": "BrandNew123!"}
+        assert client.post("/api/v1/auth/reset-password", json=body).status_code == 200
+        assert client.post("/api/v1/auth/reset-password", json=body).status_code == 400
+        
+        response = client.post("/api/v1/auth/login", json={"email": test_user_data["email"], "password": "BrandNew123!"})
+        assert response.status_code == 200
+    
+    def test_decoded_tokens_are_cached(self, monkeypatch):
+        from datetime import timedelta
+        token = security.create_access_token(subject=42)
+        expired = security.create_access_token(subject=42, expires_delta=timedelta(seconds=-1))
+        
+        decodes = []
+        real_decode = security.jwt.decode
+        monkeypatch.setattr(security.jwt, "decode", lambda *a, **kw: decodes.append(1) or real_decode(*a, **kw))
+        
+        assert security.decode_token(token) == 42
+        assert security.decode_token(token) == 42
+        assert len(decodes) == 1
+        
+        assert security.decode_token(expired) is None
+        assert security.decode_token(expired) is None
+        assert len(decodes) == 3
@@ -0,0 +1,147 @@
+import io
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
+from app.api.endpoints import chart_analysis
+from app.core import deps
+from app.models.chart_analysis import ChartAnalysis
+from app.models.user import User
+
+
+class TestChartAnalysis:
+    def test_history_pages_by_cursor(self, client, db, auth_headers, test_user_data):
+        deps._active_user_cache.clear()
+        user_id = db.query(User.id).filter(User.email == test_user_data["email"]).scalar()
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            db.add(ChartAnalysis(user_id=user_id, asset=f"A{i}", timeframe="4h", created_at=start + timedelta(hours=i)))
+        # Shares its timestamp with A2, the last row of the first page
+        db.add(ChartAnalysis(user_id=user_id, asset="A2b", timeframe="4h", created_at=start + timedelta(hours=2)))
+        db.commit()
+
+        page = client.get("/api/v1/chart/history?limit=3", headers=auth_headers).json()
+        assert [a["asset"] for a in page["analyses"]] == ["A4", "A3", "A2b"]
+        assert page["next_cursor"]
+
+        page = client.get(
+            "/api/v1/chart/history", params={"limit": 3, "before": page["next_cursor"]}, headers=auth_headers
+        ).json()
+        assert [a["asset"] for a in page["analyses"]] == ["A2", "A1", "A0"]
+        assert page["next_cursor"]
+
+        page = client.get(
+            "/api/v1/chart/history", params={"limit": 3, "before": page["next_cursor"]}, headers=auth_headers
+        ).json()
+        assert page["analyses"] == []
+        assert page["next_cursor"] is None
+
+        response = client.get("/api/v1/chart/history", params={"before": "yesterday"}, headers=auth_headers)
+        assert response.status_code == 422
+        assert client.get("/api/v1/chart/history?limit=0", headers=auth_headers).status_code == 422
+
+    def test_history_cursor_is_url_safe(self):
+        analysis = ChartAnalysis(id=7, created_at=datetime(2026, 1, 1, 12, 30, 0, 123456, tzinfo=timezone.utc))
+        cursor = chart_analysis._history_cursor(analysis)
+        assert cursor.replace("_", "").isdigit()
+        assert chart_analysis._parse_history_cursor(cursor) == (analysis.created_at, 7)
+
+    def test_analyze_rejects_unknown_timeframe(self, client, db, auth_headers):
+        from app.models.usage import APIUsage
+
+        response = client.post(
+            "/api/v1/chart/analyze",
+            data={"asset": "BTC", "timeframe": "7h"},
+            files={"file": ("chart.png", b"png", "image/png")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 422
+        assert db.query(APIUsage).count() == 0
+
+    def test_analyze_sniffs_image_bytes(self, client, db, auth_headers):
+        from app.models.usage import APIUsage
+
+        response = client.post(
+            "/api/v1/chart/analyze",
+            data={"asset": "BTC"},
+            files={"file": ("chart.png", b"<html>not an image</html>", "image/png")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert db.query(APIUsage).count() == 0
+
+    def test_oversized_body_is_rejected(self, client, auth_headers):
+        from app.core.config import settings
+
+        response = client.post(
+            "/api/v1/chart/analyze",
+            data={"asset": "BTC"},
+            files={"file": ("chart.png", b"\x89PNG\r\n\x1a\n" + b"\0" * settings.MAX_UPLOAD_BYTES, "image/png")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 413
+
+    def test_repeat_upload_reuses_analysis(self, client, db, auth_headers, test_user_data, monkeypatch):
+        from app.services.trade_intelligence import trade_intelligence
+
+        chart_analysis._analysis_cache.clear()
+        db.query(User).filter(User.email == test_user_data["email"]).update({"subscription_tier": "pro"})
+        db.commit()
+
+        calls = []
+
+        async def fake_analyze(image_path, asset, timeframe):
+            calls.append(image_path)
+            return {"pattern_detected": "Bull Flag", "confidence_score": 70}
+
+        monkeypatch.setattr(trade_intelligence, "analyze_chart_image", fake_analyze)
+
+        image = b"\x89PNG\r\n\x1a\n" + b"\0" * 64
+        for _ in range(2):
+            response = client.post(
+                "/api/v1/chart/analyze",
+                data={"asset": "btc", "timeframe": "1h"},
+                files={"file": ("chart.png", image, "image/png")},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            assert response.json()["pattern_detected"] == "Bull Flag"
+
+        assert len(calls) == 1
+        assert db.query(ChartAnalysis).count() == 2
+
+    def test_save_upload_stops_past_size_limit(self, tmp_path, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "MAX_UPLOAD_BYTES", 16)
+        path = tmp_path / "chart.png"
+        with pytest.raises(HTTPException) as exc:
+            chart_analysis._save_upload(io.BytesIO(b"\0" * 32), str(path))
+        assert exc.value.status_code == 413
+        assert not path.exists()
+
+    def test_save_upload_removes_partial_file_on_error(self, tmp_path):
+        class BrokenUpload(io.BytesIO):
+            def read(self, size=-1):
+                if self.tell():
+                    raise OSError("connection reset")
+                return super().read(size)
+
+        path = tmp_path / "chart.png"
+        with pytest.raises(OSError):
+            chart_analysis._save_upload(BrokenUpload(b"\0" * (2 * chart_analysis.UPLOAD_CHUNK_SIZE)), str(path))
+        assert not path.exists()
+
+    def test_oversized_stream_does_not_count_usage(self, client, db, auth_headers, monkeypatch):
+        from app.core.config import settings
+        from app.models.usage import APIUsage
+
+        # Past the handler's own check but under the Content-Length middleware's
+        monkeypatch.setattr(settings, "MAX_UPLOAD_BYTES", 16)
+        response = client.post(
+            "/api/v1/chart/analyze",
+            data={"asset": "BTC"},
+            files={"file": ("chart.png", b"\x89PNG\r\n\x1a\n" + b"\0" * 64, "image/png")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 413
+        assert db.query(APIUsage).count() == 0
@@ -0,0 +1,99 @@
+from app.api.endpoints import content
+from app.models.signal import Signal
+
+
+def test_static_json_endpoints(client):
+    response = client.get("/api/v1/content/compliant-claims")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == content.COMPLIANT_CLAIMS
+
+    assert client.get("/api/v1/content/disclaimer-banner").json() == content.DISCLAIMER_BANNER
+    assert client.get("/api/v1/content/screenshots").json() == content.SCREENSHOTS
+
+def test_static_pages(client):
+    response = client.get("/api/v1/content/team")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "<title>Team - ELUXRAJ</title>" in response.text
+
+    assert "How ORACLE Works" in client.get("/api/v1/content/how-oracle-works").text
+
+def test_static_content_revalidates_with_etag(client):
+    response = client.get("/api/v1/content/team")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=86400, stale-while-revalidate=604800"
+
+    response = client.get("/api/v1/content/team", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = client.get("/api/v1/content/screenshots", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+def test_static_content_is_precompressed(client):
+    response = client.get("/api/v1/content/how-oracle-works", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "How ORACLE Works" in response.text
+    gzip_etag = response.headers["etag"]
+
+    response = client.get("/api/v1/content/how-oracle-works", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] != gzip_etag
+
+    # Any encoding's validator revalidates the page
+    response = client.get(
+        "/api/v1/content/how-oracle-works",
+        headers={"Accept-Encoding": "identity", "If-None-Match": gzip_etag},
+    )
+    assert response.status_code == 304
+
+def test_backtest_report_streams_csv(client, db, monkeypatch):
+    from sqlalchemy.orm import sessionmaker
+
+    # The CSV generator opens its own session rather than using get_db
+    monkeypatch.setattr(content, "SessionLocal", sessionmaker(bind=db.get_bind()))
+    monkeypatch.setattr(content, "BACKTEST_BATCH_SIZE", 1)
+    db.add_all([
+        Signal(symbol="BTC", signal_type="buy", entry_price=100.0, status="hit_target", outcome_pnl_percent=5.0),
+        Signal(symbol="ETH", signal_type="sell", status="active"),
+    ])
+    db.commit()
+
+    response = client.get("/api/v1/content/backtest-report")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0].startswith("Signal ID,Timestamp (UTC),Symbol")
+    assert {line.split(",")[2] for line in lines[1:3]} == {"BTC", "ETH"}
+    assert lines[-1].startswith("DISCLAIMER:")
+
+def test_verified_results_stats(client, db):
+    db.add_all([
+        Signal(symbol="BTC", signal_type="buy", status="hit_target", outcome_pnl_percent=6.0),
+        Signal(symbol="ETH", signal_type="buy", status="hit_stop", outcome_pnl_percent=-2.0),
+        Signal(symbol="SOL", signal_type="buy", status="expired"),
+        Signal(symbol="ADA", signal_type="buy", status="active", outcome_pnl_percent=50.0),
+    ])
+    db.commit()
+
+    page = client.get("/api/v1/content/verified-results").text
+    assert '<div class="value">4</div>' in page
+    assert '<div class="value">3</div>' in page
+    assert "33.3%" in page
+    assert "+2.0%" in page
+
+def test_verified_results_revalidates_until_stats_change(client, db):
+    response = client.get("/api/v1/content/verified-results")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+    response = client.get("/api/v1/content/verified-results", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    db.add(Signal(symbol="BTC", signal_type="buy", status="hit_target", outcome_pnl_percent=6.0))
+    db.commit()
+    response = client.get("/api/v1/content/verified-results", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
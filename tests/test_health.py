@@ -9,3 +9,12 @@ def test_health(client):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
+
+def test_large_responses_are_gzipped(client):
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers